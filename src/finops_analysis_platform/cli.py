@@ -116,5 +116,12 @@ def profile(config, dataset):
         click.echo(f"⚠️ Dataset '{dataset}' not found.")
 
 
+@main.command()
+def discounts():
+    """Show the CUD discount reference table for each machine type."""
+    table = MachineTypeDiscountMapping().build_reference_table()
+    click.echo(table.to_string())
+
+
 if __name__ == "__main__":
     main()
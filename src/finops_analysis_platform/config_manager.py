@@ -5,17 +5,23 @@ YAML file and allows for overrides from environment variables, providing a
 flexible and robust way to configure the application.
 """
 
+import copy
 import logging
 import os
+from dataclasses import asdict, fields, is_dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, get_type_hints
 
 import yaml
 from dotenv import load_dotenv
 
+from .config_schema import AppConfig
+
 # Set up a logger for this module
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
 
 class ConfigManager:
     """Manages loading and accessing of application configuration.
@@ -26,6 +32,8 @@ class ConfigManager:
 
     Attributes:
         config: A dictionary holding the final, merged configuration.
+        settings: A validated, immutable `AppConfig` view of `config`, rebuilt
+            whenever `config` is assigned.
     """
 
     def __init__(
@@ -40,9 +48,23 @@ class ConfigManager:
         """
         self.config_path = Path(config_path)
         self.env_path = Path(env_path) if env_path else None
-        self.config: Dict[str, Any] = {}
+        self._config: Dict[str, Any] = {}
+        self._section_dicts: Dict[str, Dict[str, Any]] = {}
+        self.settings = AppConfig()
         self._load_config()
 
+    @property
+    def config(self) -> Dict[str, Any]:
+        """The raw, merged configuration dictionary."""
+        return self._config
+
+    @config.setter
+    def config(self, value: Optional[Dict[str, Any]]):
+        """Replaces the configuration and re-validates it against the schema."""
+        self._config = value if value is not None else {}
+        self.settings = AppConfig.from_dict(self._config)
+        self._section_dicts = {}
+
     def _load_config(self):
         """Loads configuration from YAML and overrides with environment variables."""
         if self.env_path and self.env_path.is_file():
@@ -51,7 +73,7 @@ class ConfigManager:
 
         if self.config_path.is_file():
             with open(self.config_path, "r", encoding="utf-8") as file_handle:
-                self.config = yaml.safe_load(file_handle)
+                raw_config = yaml.safe_load(file_handle) or {}
                 logger.info("Loaded configuration from %s", self.config_path)
         elif self.config_path != Path("config.yaml"):  # Only warn if non-default path
             logger.error(
@@ -63,18 +85,26 @@ class ConfigManager:
             logger.info(
                 "Default config file not found. Using environment variables only."
             )
-            self.config = self._get_default_config()
+            raw_config = self._get_default_config()
 
-        self._override_with_env_vars(self.config)
-        self._infer_gcp_project()
+        # Snapshot the environment once so the recursive override pass does
+        # plain dict lookups instead of going through the os.environ wrapper.
+        env = dict(os.environ)
+        self._override_with_env_vars(raw_config, env=env)
+        self._infer_gcp_project(raw_config, env)
+        # Validate once; all later reads go through the typed settings.
+        self.config = raw_config
 
-    def _infer_gcp_project(self):
-        """Infers GCP project ID from standard env vars if not set."""
-        gcp_config = self.config.setdefault("gcp", {})
+    def _infer_gcp_project(self, config_dict: Dict[str, Any], env: Dict[str, str]):
+        """Infers GCP project ID from standard env vars if not set.
+
+        Args:
+            config_dict: The raw configuration dictionary to update.
+            env: A snapshot of the process environment variables.
+        """
+        gcp_config = config_dict.setdefault("gcp", {})
         if "project_id" not in gcp_config or not gcp_config["project_id"]:
-            project_id = os.getenv("GCP_PROJECT_ID") or os.getenv(
-                "GOOGLE_CLOUD_PROJECT"
-            )
+            project_id = env.get("GCP_PROJECT_ID") or env.get("GOOGLE_CLOUD_PROJECT")
             if project_id:
                 gcp_config["project_id"] = project_id
                 logger.info(
@@ -90,7 +120,13 @@ class ConfigManager:
             "cud_strategy": {"base_layer_coverage": 40},
         }
 
-    def _override_with_env_vars(self, config_dict: Dict[str, Any], prefix: str = ""):
+    def _override_with_env_vars(
+        self,
+        config_dict: Dict[str, Any],
+        prefix: str = "",
+        env: Optional[Dict[str, str]] = None,
+        schema: Any = AppConfig,
+    ):
         """Recursively overrides dictionary values with environment variables.
 
         Example: A config {'gcp': {'project_id': 'x'}} will look for an
@@ -99,13 +135,31 @@ class ConfigManager:
         Args:
             config_dict: The dictionary to override.
             prefix: The prefix to use for constructing the env var name.
+            env: A snapshot of the environment variables. If None, a snapshot
+                of `os.environ` is taken.
+            schema: The `AppConfig` section describing `config_dict`, or None
+                if the dictionary lies outside the schema.
+
+        Raises:
+            ValueError: If an environment variable cannot be converted to the
+                type of a schema value it overrides. Values outside the schema
+                keep the string instead.
         """
+        if env is None:
+            env = dict(os.environ)
+        schema_types = get_type_hints(schema) if schema is not None else {}
         for key, value in config_dict.items():
             if isinstance(value, dict):
-                self._override_with_env_vars(value, prefix=f"{prefix}{key}_")
+                section = schema_types.get(key)
+                self._override_with_env_vars(
+                    value,
+                    prefix=f"{prefix}{key}_",
+                    env=env,
+                    schema=section if is_dataclass(section) else None,
+                )
             else:
                 env_var_name = (prefix + key).upper()
-                env_value = os.getenv(env_var_name)
+                env_value = env.get(env_var_name)
                 if env_value is not None:
                     # Attempt to cast the environment variable to the original type
                     original_value = config_dict[key]
@@ -131,13 +185,22 @@ class ConfigManager:
                             prefix + key,
                             env_var_name,
                         )
-                    except (ValueError, TypeError):
-                        config_dict[key] = env_value
-                        logger.warning(
-                            "Could not cast env var '%s' to type of '%s'. Using string.",
-                            env_var_name,
-                            key,
-                        )
+                    except (ValueError, TypeError) as exception:
+                        if key not in schema_types:
+                            logger.warning(
+                                "Could not cast env var '%s' to %s for config "
+                                "'%s'. Using string.",
+                                env_var_name,
+                                type(original_value).__name__,
+                                prefix + key,
+                            )
+                            config_dict[key] = env_value
+                            continue
+                        raise ValueError(
+                            f"Invalid value for env var '{env_var_name}': expected "
+                            f"{type(original_value).__name__} for config "
+                            f"'{prefix + key}', got {env_value!r}."
+                        ) from exception
 
     def get(self, key: str, default: Any = None) -> Any:
         """Gets a configuration value using dot notation for nested keys.
@@ -147,17 +210,68 @@ class ConfigManager:
             default: The default value to return if the key is not found.
 
         Returns:
-            The requested configuration value or the default.
+            The requested configuration value or the default. Dicts and lists
+            are returned as copies.
         """
         keys = key.split(".")
-        value = self.config
+        value = self._get_from_settings(keys)
+        if value is _MISSING:
+            value = self._get_from_raw(keys)
+        if value is _MISSING:
+            return default
+        if is_dataclass(value):
+            return self._section_as_dict(key, value)
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
+
+    def _get_from_settings(self, keys: List[str]) -> Any:
+        """Resolves a key path through the typed settings via attribute access.
+
+        Unset optional values (None) are reported as missing so that the
+        caller's default, or the raw dictionary, is used instead.
+        """
+        value: Any = self.settings
+        for k in keys:
+            if is_dataclass(value):
+                value = getattr(value, k, _MISSING)
+            elif isinstance(value, dict):
+                value = value.get(k, _MISSING)
+            else:
+                return _MISSING
+            if value is _MISSING or value is None:
+                return _MISSING
+        return value
+
+    def _get_from_raw(self, keys: List[str]) -> Any:
+        """Resolves a key path through the raw configuration dictionary."""
+        value: Any = self._config
         for k in keys:
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
-                return default
+                return _MISSING
         return value
 
+    def _section_as_dict(self, key: str, section: Any) -> Dict[str, Any]:
+        """Returns a typed section as a plain dict, built lazily and cached.
+
+        Keys present in the raw configuration but outside the schema are
+        merged in so that no user-supplied setting is hidden. Callers get a
+        copy, so mutating it cannot desynchronize the cached section from
+        the typed settings.
+        """
+        if key not in self._section_dicts:
+            section_dict = asdict(section)
+            raw_section = self._get_from_raw(key.split("."))
+            if isinstance(raw_section, dict):
+                schema_keys = {schema_field.name for schema_field in fields(section)}
+                section_dict.update(
+                    {k: v for k, v in raw_section.items() if k not in schema_keys}
+                )
+            self._section_dicts[key] = section_dict
+        return copy.deepcopy(self._section_dicts[key])
+
     def __getitem__(self, key: str) -> Any:
         """Gets a configuration value using dictionary-style access.
 
@@ -168,12 +282,13 @@ class ConfigManager:
             key: The top-level configuration key to retrieve.
 
         Returns:
-            The requested configuration value.
+            A copy of the requested configuration value, so that mutating it
+            cannot desynchronize the raw configuration from `settings`.
 
         Raises:
             KeyError: If the key is not found in the configuration.
         """
-        return self.config[key]
+        return copy.deepcopy(self.config[key])
 
     def __repr__(self) -> str:
         """Returns a string representation of the ConfigManager instance."""
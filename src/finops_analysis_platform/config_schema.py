@@ -0,0 +1,253 @@
+"""Defines the typed schema for the application configuration.
+
+The raw YAML configuration (after environment variable overrides) is
+converted once at load time into frozen, slotted dataclasses. This validates
+value types up front and turns nested lookups into plain attribute access.
+"""
+
+import logging
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import (
+    Any,
+    Dict,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CompanyConfig:
+    """Organization details used in reports."""
+
+    name: str = "Your Company"
+    currency: str = "USD"
+    fiscal_year_start: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class GcpConfig:
+    """Google Cloud project settings."""
+
+    project_id: Optional[str] = None
+    location: str = "us-central1"
+    bucket_name: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class GcsConfig:
+    """Google Cloud Storage layout settings."""
+
+    bucket_name: Optional[str] = None
+    billing_data_path: str = "data/billing/"
+    recommendations_path: str = "data/recommendations/"
+    manual_analysis_path: str = "data/manual_analysis/"
+    reports_output_path: str = "reports/cfo_dashboard/"
+
+
+@dataclass(frozen=True, slots=True)
+class BigQueryConfig:
+    """BigQuery billing export settings."""
+
+    dataset_id: Optional[str] = None
+    table_id: Optional[str] = None
+    location: str = "US"
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisConfig:
+    """Parameters controlling the CUD analysis."""
+
+    lookback_days: Optional[int] = None
+    risk_tolerance: str = "medium"
+    forecast_months: int = 3
+    target_utilization: float = 85
+    minimum_acceptable_utilization: float = 60
+
+
+@dataclass(frozen=True, slots=True)
+class CudStrategyConfig:
+    """Coverage percentages for each layer of the CUD portfolio."""
+
+    base_layer_coverage: float = 40
+    growth_layer_coverage: float = 30
+    flex_layer_coverage: float = 20
+    burst_layer_coverage: float = 10
+
+
+@dataclass(frozen=True, slots=True)
+class FinancialConfig:
+    """Rates used for financial calculations."""
+
+    discount_rate: float = 0.10
+    tax_rate: float = 0.21
+    risk_free_rate: float = 0.04
+
+
+@dataclass(frozen=True, slots=True)
+class ApiKeysConfig:
+    """Optional API keys for enhanced features."""
+
+    google_gemini_api_key: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class ReportingConfig:
+    """Report generation settings."""
+
+    include_ai_insights: bool = False
+    generate_pdf: bool = True
+    create_dashboard: bool = False
+    send_email_notifications: bool = False
+    email_recipients: Tuple[str, ...] = ()
+    company_logo_path: Optional[str] = None
+    theme_colors: Optional[Dict[str, str]] = None
+
+
+@dataclass(frozen=True, slots=True)
+class MonitoringConfig:
+    """Cost anomaly alerting settings."""
+
+    enable_alerts: bool = True
+    alert_threshold_percentage: float = 20
+    check_frequency_hours: int = 24
+
+
+@dataclass(frozen=True, slots=True)
+class AdvancedConfig:
+    """Toggles for the advanced quantitative models."""
+
+    enable_monte_carlo: bool = True
+    simulation_iterations: int = 10000
+    enable_portfolio_optimization: bool = True
+    enable_stress_testing: bool = True
+    ai_cache_dir: Optional[str] = None
+    ai_cache_ttl_seconds: int = 86400
+
+
+@dataclass(frozen=True, slots=True)
+class LoggingConfig:
+    """Logging settings."""
+
+    level: str = "INFO"
+    file_path: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    """The complete, validated application configuration.
+
+    Attributes:
+        company: Organization details.
+        gcp: Google Cloud project settings.
+        gcs: Google Cloud Storage layout settings.
+        bigquery: BigQuery billing export settings.
+        analysis: Parameters controlling the CUD analysis.
+        cud_strategy: Coverage percentages for each portfolio layer.
+        financial: Rates used for financial calculations.
+        api_keys: Optional API keys.
+        reporting: Report generation settings.
+        monitoring: Cost anomaly alerting settings.
+        advanced: Toggles for the advanced quantitative models.
+        logging: Logging settings.
+    """
+
+    company: CompanyConfig = field(default_factory=CompanyConfig)
+    gcp: GcpConfig = field(default_factory=GcpConfig)
+    gcs: GcsConfig = field(default_factory=GcsConfig)
+    bigquery: BigQueryConfig = field(default_factory=BigQueryConfig)
+    analysis: AnalysisConfig = field(default_factory=AnalysisConfig)
+    cud_strategy: CudStrategyConfig = field(default_factory=CudStrategyConfig)
+    financial: FinancialConfig = field(default_factory=FinancialConfig)
+    api_keys: ApiKeysConfig = field(default_factory=ApiKeysConfig)
+    reporting: ReportingConfig = field(default_factory=ReportingConfig)
+    monitoring: MonitoringConfig = field(default_factory=MonitoringConfig)
+    advanced: AdvancedConfig = field(default_factory=AdvancedConfig)
+    logging: LoggingConfig = field(default_factory=LoggingConfig)
+
+    @classmethod
+    def from_dict(cls, raw: Optional[Mapping[str, Any]]) -> "AppConfig":
+        """Builds and validates an `AppConfig` from a raw configuration dict.
+
+        Keys that are not part of the schema are ignored here; they remain
+        available through the raw dictionary held by the `ConfigManager`.
+
+        Args:
+            raw: The parsed configuration dictionary.
+
+        Returns:
+            The validated, immutable configuration.
+
+        Raises:
+            ValueError: If a known key holds a value of the wrong type.
+        """
+        return _build_section(cls, raw or {}, "")
+
+
+def _build_section(schema: Any, raw: Any, path: str) -> Any:
+    """Recursively constructs a schema dataclass from a raw mapping."""
+    if raw is None:
+        raw = {}
+    if not isinstance(raw, Mapping):
+        raise ValueError(
+            f"Config section '{path.rstrip('.') or '<root>'}' must be a mapping, "
+            f"got {type(raw).__name__}."
+        )
+
+    hints = get_type_hints(schema)
+    known = set()
+    kwargs: Dict[str, Any] = {}
+    for schema_field in fields(schema):
+        known.add(schema_field.name)
+        if schema_field.name not in raw:
+            continue
+        value = raw[schema_field.name]
+        hint = hints[schema_field.name]
+        name = f"{path}{schema_field.name}"
+        if is_dataclass(hint):
+            kwargs[schema_field.name] = _build_section(hint, value, f"{name}.")
+        else:
+            kwargs[schema_field.name] = _coerce(value, hint, name)
+
+    unknown = set(raw) - known
+    if unknown:
+        logger.debug(
+            "Config section '%s' has keys outside the schema: %s",
+            path.rstrip(".") or "<root>",
+            sorted(unknown),
+        )
+    return schema(**kwargs)
+
+
+def _coerce(value: Any, hint: Any, name: str) -> Any:
+    """Validates a leaf value against its annotation, normalizing containers."""
+    if get_origin(hint) is Union:
+        if value is None:
+            return None
+        hint = next(arg for arg in get_args(hint) if arg is not type(None))
+
+    origin = get_origin(hint) or hint
+    is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+    if origin is bool and isinstance(value, bool):
+        return value
+    if origin is int and is_number and float(value).is_integer():
+        return int(value)
+    if origin is float and is_number:
+        return value
+    if origin is str and isinstance(value, str):
+        return value
+    if origin is tuple and isinstance(value, (list, tuple)):
+        return tuple(value)
+    if origin is dict and isinstance(value, Mapping):
+        return dict(value)
+
+    raise ValueError(
+        f"Invalid value for config '{name}': expected {getattr(hint, '__name__', hint)}, "
+        f"got {type(value).__name__} ({value!r})."
+    )
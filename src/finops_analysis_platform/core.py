@@ -1,13 +1,16 @@
 """Core analysis engine for the FinOps CUD Analysis Platform."""
 
+import copy
+import hashlib
+import json
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 import pandas as pd
 
 from .config_manager import ConfigManager
-from .models import AnalysisResults
+from .models import AnalysisResults, PortfolioRecommendation
 from .portfolio_recommender import AIPortfolioRecommender, RuleBasedPortfolioRecommender
 from .recommendation_analyzer import RecommendationAnalyzer
 from .risk_assessor import RiskAssessor
@@ -55,18 +58,20 @@ class CUDAnalyzer:
         self.recommendation_analyzer = recommendation_analyzer
         self.billing_data = self._validate_billing_data(billing_data)
         self.recommendations_data = recommendations_data
+        self._cached_analysis: Optional[Tuple[Tuple[Any, ...], AnalysisResults]] = None
 
     def _validate_billing_data(
         self, dataframe: Optional[pd.DataFrame]
     ) -> Optional[pd.DataFrame]:
         """Validates that the billing DataFrame has the required columns."""
         if dataframe is None or dataframe.empty:
-            logger.warning("Billing data is empty. Analysis may use sample data.")
+            logger.warning(
+                "Billing data is empty; CUD recommendations will be skipped."
+            )
             return None
-        required_cols = ["Cost"]
-        sku_cols = ["SKU", "Sku Description"]
-        has_sku = any(col in dataframe.columns for col in sku_cols)
-        has_required = all(col in dataframe.columns for col in required_cols)
+        columns = set(dataframe.columns)
+        has_sku = not columns.isdisjoint(("SKU", "Sku Description"))
+        has_required = "Cost" in columns
         if not has_sku or not has_required:
             logger.error(
                 "Billing data is missing required columns ('Cost' and "
@@ -86,16 +91,48 @@ class CUDAnalyzer:
         Returns:
             An `AnalysisResults` object containing the complete analysis.
         """
+        self.savings_calculator.discount_mapping.reload_if_changed()
+        cache_key = self._analysis_cache_key()
+        if (
+            cache_key is not None
+            and self._cached_analysis is not None
+            and self._cached_analysis[0] == cache_key
+        ):
+            logger.info("Inputs unchanged; returning the cached CUD analysis.")
+            return copy.deepcopy(self._cached_analysis[1])
+
         logger.info("Starting comprehensive CUD analysis...")
-        machine_distribution = self.spend_analyzer.analyze_machine_distribution(
-            self.billing_data
-        )
-        savings_by_machine = self.savings_calculator.calculate_savings_by_machine(
-            machine_distribution
-        )
-        portfolio = self.rule_based_recommender.recommend_portfolio(savings_by_machine)
-        risk_assessment = self.risk_assessor.assess_risk(savings_by_machine)
-        ai_portfolio = self.ai_recommender.recommend_portfolio(savings_by_machine)
+        # One timestamp and config snapshot for the whole run.
+        analysis_date = datetime.now()
+        analysis_config = self.config_manager.get("analysis", {})
+        # The spend analyzer substitutes a sample distribution for missing
+        # billing data, so the absence of real spend is checked up front.
+        if self.billing_data is None or self.billing_data.empty:
+            machine_distribution: Dict[str, float] = {}
+        else:
+            machine_distribution = self.spend_analyzer.analyze_machine_distribution(
+                self.billing_data
+            )
+        if machine_distribution:
+            # The savings frame is computed once and shared by the rule-based
+            # and risk steps; the nested dict is only built for the results
+            # and the AI prompt.
+            savings_frame = self.savings_calculator._calculate_savings_frame_by_base(
+                machine_distribution
+            )
+            savings_by_machine = self.savings_calculator.frame_to_dict(savings_frame)
+            savings_summary = self.savings_calculator.summarize_savings(savings_frame)
+            portfolio = self.rule_based_recommender.recommend_portfolio(savings_frame)
+            risk_assessment = self.risk_assessor.assess_risk(savings_frame)
+            ai_portfolio = self.ai_recommender.recommend_portfolio(savings_by_machine)
+        else:
+            # Nothing to commit to: skip the savings, portfolio and AI steps.
+            logger.warning("No billing spend found; skipping CUD recommendations.")
+            savings_by_machine = {}
+            savings_summary = None
+            portfolio = PortfolioRecommendation()
+            risk_assessment = self.risk_assessor.assess_risk(savings_by_machine)
+            ai_portfolio = None
         active_assist = self.recommendation_analyzer.analyze(self.recommendations_data)
 
         analysis = AnalysisResults(
@@ -105,8 +142,44 @@ class CUDAnalyzer:
             ai_portfolio_recommendation=ai_portfolio,
             risk_assessment=risk_assessment,
             active_assist_summary=active_assist,
-            analysis_date=datetime.now(),
-            config=self.config_manager.get("analysis", {}),
+            total_savings_summary=savings_summary,
+            analysis_date=analysis_date,
+            config=analysis_config,
         )
+        ai_failed = isinstance(ai_portfolio, dict) and "error" in ai_portfolio
+        if cache_key is not None and not ai_failed:
+            self._cached_analysis = (cache_key, copy.deepcopy(analysis))
+        elif ai_failed:
+            # Do not pin a transient AI failure: the next run retries it.
+            logger.info("AI portfolio step failed; not caching this analysis.")
         logger.info("Comprehensive CUD analysis complete.")
         return analysis
+
+    def _analysis_cache_key(self) -> Optional[Tuple[Any, ...]]:
+        """Fingerprints the analysis inputs: data, configuration and discounts.
+
+        Returns:
+            A hashable key, or None if an input cannot be fingerprinted (in
+            which case the result is not cached).
+        """
+        try:
+            return (
+                _fingerprint_frame(self.billing_data),
+                _fingerprint_frame(self.recommendations_data),
+                json.dumps(self.config_manager.config, sort_keys=True, default=str),
+                self.savings_calculator.discount_mapping.loaded_version,
+            )
+        except TypeError as exception:
+            logger.debug("Analysis inputs are not hashable: %s", exception)
+            return None
+
+
+def _fingerprint_frame(dataframe: Optional[pd.DataFrame]) -> Optional[Tuple[Any, ...]]:
+    """Returns a content hash of a DataFrame, including its column labels."""
+    if dataframe is None:
+        return None
+    row_hashes = pd.util.hash_pandas_object(dataframe, index=False).to_numpy()
+    return (
+        tuple(dataframe.columns),
+        hashlib.sha1(row_hashes.tobytes(), usedforsecurity=False).hexdigest(),
+    )
@@ -7,52 +7,67 @@ falls back to loading local sample data for demonstration purposes.
 
 from __future__ import annotations
 
-import io
+import functools
 import logging
 import os
-from pathlib import Path
-from typing import Dict, Union
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Union
 
 import google.auth
 import numpy as np
 import pandas as pd
+import requests
 from google.auth.exceptions import DefaultCredentialsError
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import storage
+from google.cloud.storage.retry import DEFAULT_RETRY
 
 from .config_manager import ConfigManager
 from .data_loader_protocol import DataLoader
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent blob downloads per GCS folder.
+MAX_DOWNLOAD_WORKERS = 16
+
+# Retry transient GCS errors with exponential backoff, for at most 30 seconds.
+_GCS_RETRY = DEFAULT_RETRY.with_timeout(30.0)
+# GCS folder that generated reports are uploaded to.
+REPORTS_PREFIX = "reports/cfo_dashboard/"
+# A plain file name: no directories, no "." or "..", no control characters.
+_SAFE_FILENAME = re.compile(r"(?!\.{1,2}$)[A-Za-z0-9._-]{1,255}")
+
+# Shared PCG64 generator for all sample data.
+_RNG = np.random.default_rng()
+
 # --- Sample Data Generation Functions ---
 
 
-def _generate_realistic_cost_vectorized(
-    usage_series: pd.Series,
-    sku_series: pd.Series,
-) -> pd.Series:
-    """Generates a realistic cost based on usage and SKU in a vectorized way.
+# Sample machine types and their approximate cost per usage unit (USD).
+_SAMPLE_MACHINE_TYPES = np.array(
+    [
+        "n2-standard-8",
+        "n2-highmem-4",
+        "e2-standard-4",
+        "c2-standard-16",
+        "m1-megamem-96",
+        "t2d-standard-8",
+        "a2-highgpu-1g",
+        "gpu-t4-instance",
+    ]
+)
+_SAMPLE_UNIT_COSTS = np.array([0.1, 0.1, 0.05, 0.15, 0.5, 0.1, 1.2, 2.5])
+# Sample projects and the share of billing rows each one receives.
+_SAMPLE_PROJECTS = np.array([f"project-{chr(97 + i)}" for i in range(5)])
+_SAMPLE_PROJECT_WEIGHTS = np.array([0.4, 0.3, 0.15, 0.1, 0.05])
+_NS_PER_HOUR = 3_600 * 10**9
+_NS_PER_DAY = 24 * _NS_PER_HOUR
 
-    Args:
-        usage_series: A pandas Series containing usage amounts.
-        sku_series: A pandas Series containing SKU descriptions.
 
-    Returns:
-        A pandas Series with the calculated costs.
-    """
-    base_costs = {
-        "n2": 0.1,
-        "e2": 0.05,
-        "c2": 0.15,
-        "m1": 0.5,
-        "t2": 0.08,
-        "a2": 1.2,
-        "gpu": 2.5,
-    }
-    sku_families = sku_series.str.split("-").str[0]
-    cost_multipliers = sku_families.map(base_costs).fillna(0.1)
-    random_factors = 1 + np.random.uniform(-0.1, 0.1, len(usage_series))
-    return usage_series * cost_multipliers * random_factors
+def _constant_categorical(value: str, rows: int) -> pd.Categorical:
+    """Builds a column repeating one label, stored as one-byte codes."""
+    return pd.Categorical.from_codes(np.zeros(rows, dtype=np.int8), [value])
 
 
 def generate_sample_billing_data(rows: int = 1000) -> pd.DataFrame:
@@ -64,36 +79,32 @@ def generate_sample_billing_data(rows: int = 1000) -> pd.DataFrame:
     Returns:
         A pandas DataFrame with sample billing data.
     """
-    machine_types = [
-        "n2-standard-8",
-        "n2-highmem-4",
-        "e2-standard-4",
-        "c2-standard-16",
-        "m1-megamem-96",
-        "t2d-standard-8",
-        "a2-highgpu-1g",
-        "gpu-t4-instance",
-    ]
-    projects = [f"project-{chr(97 + i)}" for i in range(5)]
-    start_times = pd.to_datetime(
-        pd.to_datetime("now", utc=True)
-        - pd.to_timedelta(np.random.rand(rows) * 90, "D")
+    # Costs are drawn by machine type index, so no SKU strings are parsed.
+    machine_index = _RNG.integers(0, len(_SAMPLE_MACHINE_TYPES), rows)
+    usage = _RNG.gamma(2, 250, rows)
+    cost = (
+        usage * _SAMPLE_UNIT_COSTS[machine_index] * (1 + _RNG.uniform(-0.1, 0.1, rows))
+    )
+    # Timestamps are drawn as int64 nanoseconds and viewed as datetimes once,
+    # avoiding intermediate timedelta arrays.
+    start_ns = pd.Timestamp.now(tz="UTC").value - _RNG.integers(
+        0, 90 * _NS_PER_DAY, rows, dtype=np.int64
     )
+    end_ns = start_ns + _RNG.integers(1, 24, rows, dtype=np.int64) * _NS_PER_HOUR
+    project_index = _RNG.choice(len(_SAMPLE_PROJECTS), rows, p=_SAMPLE_PROJECT_WEIGHTS)
+    # Low-cardinality labels are built directly as categoricals from the
+    # drawn indices: compact, grouped by code, and no per-row strings.
     data = {
-        "SKU": np.random.choice(machine_types, rows),
-        "Service": ["Compute Engine"] * rows,
-        "Usage": np.random.gamma(2, 250, rows),
-        "Project": np.random.choice(projects, rows, p=[0.4, 0.3, 0.15, 0.1, 0.05]),
-        "Start Time": start_times,
+        "SKU": pd.Categorical.from_codes(machine_index, _SAMPLE_MACHINE_TYPES),
+        "Service": _constant_categorical("Compute Engine", rows),
+        "Usage": usage,
+        "Project": pd.Categorical.from_codes(project_index, _SAMPLE_PROJECTS),
+        "Start Time": pd.DatetimeIndex(start_ns.view("datetime64[ns]"), tz="UTC"),
+        "End Time": pd.DatetimeIndex(end_ns.view("datetime64[ns]"), tz="UTC"),
+        "Cost": cost,
     }
-    dataframe = pd.DataFrame(data)
-    dataframe["End Time"] = dataframe["Start Time"] + pd.to_timedelta(
-        np.random.randint(1, 24, rows), "h"
-    )
-    dataframe["Cost"] = _generate_realistic_cost_vectorized(
-        dataframe["Usage"], dataframe["SKU"]
-    )
-    return dataframe
+    # Every column is ready, so the frame is built in one constructor call.
+    return pd.DataFrame(data)
 
 
 def generate_sample_recommendations_data(rows: int = 50) -> pd.DataFrame:
@@ -113,9 +124,9 @@ def generate_sample_recommendations_data(rows: int = 50) -> pd.DataFrame:
     ]
     data = {
         "Resource": [f"instance-{i}" for i in range(rows)],
-        "Recommendation": np.random.choice(recommendation_types, rows),
-        "Monthly savings": np.random.uniform(5, 500, rows),
-        "Impact": np.random.choice(["Low", "Medium", "High"], rows),
+        "Recommendation": _RNG.choice(recommendation_types, rows),
+        "Monthly savings": _RNG.uniform(5, 500, rows),
+        "Impact": _RNG.choice(["Low", "Medium", "High"], rows),
     }
     return pd.DataFrame(data)
 
@@ -131,12 +142,12 @@ def generate_sample_manual_analysis_data(rows: int = 100) -> pd.DataFrame:
     """
     data = {
         "Sku Id": [f"sku-{i}" for i in range(rows)],
-        "Sku Description": np.random.choice(["n2-standard-4", "e2-medium"], rows),
-        "Project": np.random.choice(["project-a", "project-b"], rows),
-        "Cost": np.random.uniform(100, 5000, rows),
-        "Credits": np.random.uniform(0, 500, rows),
-        "Usage Amount": np.random.uniform(1, 1000, rows),
-        "Usage Unit": ["hours"] * rows,
+        "Sku Description": _RNG.choice(["n2-standard-4", "e2-medium"], rows),
+        "Project": _RNG.choice(["project-a", "project-b"], rows),
+        "Cost": _RNG.uniform(100, 5000, rows),
+        "Credits": _RNG.uniform(0, 500, rows),
+        "Usage Amount": _RNG.uniform(1, 1000, rows),
+        "Usage Unit": _constant_categorical("hours", rows),
     }
     return pd.DataFrame(data)
 
@@ -162,6 +173,31 @@ def generate_sample_spend_distribution() -> Dict[str, float]:
     }
 
 
+@functools.lru_cache(maxsize=1)
+def _default_storage_client() -> storage.Client:
+    """Returns the process-wide GCS client for the default credentials.
+
+    The client is thread-safe and owns the HTTP connection pool, so every
+    loader shares it. Authentication errors are raised rather than cached,
+    letting a later loader retry.
+    """
+    credentials, project = google.auth.default()
+    logger.info("Successfully authenticated with Google Cloud.")
+    # The default pool keeps 10 connections per host; size it to the download
+    # workers so concurrent reads reuse connections instead of reopening TLS.
+    # The session is built the way the client would build it, so mTLS is
+    # still configured afterwards and replaces this adapter when enabled.
+    session = AuthorizedSession(credentials)
+    session.mount(
+        "https://",
+        requests.adapters.HTTPAdapter(
+            pool_connections=MAX_DOWNLOAD_WORKERS, pool_maxsize=MAX_DOWNLOAD_WORKERS
+        ),
+    )
+    session.configure_mtls_channel()
+    return storage.Client(credentials=credentials, project=project, _http=session)
+
+
 class GCSDataLoader(DataLoader):
     """Loads data from a structured Google Cloud Storage bucket."""
 
@@ -183,9 +219,7 @@ class GCSDataLoader(DataLoader):
     def _initialize_client(self) -> Union[storage.Client, None]:
         """Initializes the GCS client, handling authentication."""
         try:
-            credentials, project = google.auth.default()
-            logger.info("Successfully authenticated with Google Cloud.")
-            return storage.Client(credentials=credentials, project=project)
+            return _default_storage_client()
         except DefaultCredentialsError:
             logger.warning(
                 "Google Cloud authentication failed. Could not find default "
@@ -229,6 +263,7 @@ class GCSDataLoader(DataLoader):
         data_frames: Dict[str, pd.DataFrame] = {}
         try:
             bucket = self.storage_client.bucket(self.bucket_name)
+            blobs_by_type = self._list_csv_blobs_by_type(bucket)
             for data_type, folder_path in self.GCS_STRUCTURE.items():
                 logger.info(
                     "Loading '%s' data from gs://%s/%s",
@@ -236,16 +271,17 @@ class GCSDataLoader(DataLoader):
                     self.bucket_name,
                     folder_path,
                 )
-                blobs = list(bucket.list_blobs(prefix=folder_path))
-                if not blobs:
+                csv_blobs = blobs_by_type[data_type]
+                if not csv_blobs:
                     logger.info("No files found in %s.", folder_path)
                     continue
 
-                dataframe_list = [
-                    self._process_blob(blob)
-                    for blob in blobs
-                    if blob.name.endswith(".csv")
-                ]
+                # Downloads are latency-bound, so fetch files concurrently;
+                # map() keeps the results in listing order.
+                with ThreadPoolExecutor(
+                    max_workers=min(MAX_DOWNLOAD_WORKERS, len(csv_blobs))
+                ) as executor:
+                    dataframe_list = list(executor.map(self._process_blob, csv_blobs))
 
                 valid_dataframes = [df for df in dataframe_list if df is not None]
                 if valid_dataframes:
@@ -267,11 +303,73 @@ class GCSDataLoader(DataLoader):
 
         return data_frames
 
+    @staticmethod
+    def _list_csv_blobs(bucket: storage.Bucket, folder_path: str) -> List[storage.Blob]:
+        """Lists the CSV blobs under a folder, including nested folders."""
+        # Match CSV files server-side so other objects are never listed.
+        return list(
+            bucket.list_blobs(prefix=folder_path, match_glob=f"{folder_path}**.csv")
+        )
+
+    def _list_csv_blobs_by_type(
+        self, bucket: storage.Bucket
+    ) -> Dict[str, List[storage.Blob]]:
+        """Lists the CSV blobs of every data type with a single listing.
+
+        All folders of `GCS_STRUCTURE` share a parent folder, so one paginated
+        listing of that parent replaces a listing per data type; blobs are
+        then assigned to the data type whose folder contains them.
+        """
+        folders = list(self.GCS_STRUCTURE.values())
+        common = os.path.commonprefix(folders)
+        root = common[: common.rfind("/") + 1]
+        blobs_by_type: Dict[str, List[storage.Blob]] = {
+            data_type: [] for data_type in self.GCS_STRUCTURE
+        }
+        for blob in self._list_csv_blobs(bucket, root):
+            for data_type, folder_path in self.GCS_STRUCTURE.items():
+                if blob.name.startswith(folder_path):
+                    blobs_by_type[data_type].append(blob)
+                    break
+        return blobs_by_type
+
+    def iter_csv_chunks(
+        self, data_type: str = "billing", chunksize: int = 100_000, **read_csv_kwargs
+    ) -> Iterator[pd.DataFrame]:
+        """Streams the CSV files of one data type as bounded-size chunks.
+
+        Unlike `load_all_data`, no file is ever held in memory as a whole, so
+        exports larger than the available RAM can be reduced incrementally,
+        e.g. with `SpendAnalyzer.analyze_machine_distribution_chunks`.
+
+        Args:
+            data_type: A key of `GCS_STRUCTURE`, e.g. "billing".
+            chunksize: The number of rows per yielded DataFrame.
+            **read_csv_kwargs: Extra arguments for `pd.read_csv`, such as
+                `usecols` or `dtype`.
+
+        Yields:
+            DataFrames of at most `chunksize` rows, file by file in listing
+            order.
+        """
+        if not self.storage_client:
+            return
+        bucket = self.storage_client.bucket(self.bucket_name)
+        for blob in self._list_csv_blobs(bucket, self.GCS_STRUCTURE[data_type]):
+            logger.debug("Streaming %s in chunks of %d rows.", blob.name, chunksize)
+            with (
+                blob.open("rb", retry=_GCS_RETRY) as stream,
+                pd.read_csv(stream, chunksize=chunksize, **read_csv_kwargs) as reader,
+            ):
+                yield from reader
+
     def _process_blob(self, blob: storage.Blob) -> Union[pd.DataFrame, None]:
-        """Downloads and parses a single CSV blob into a DataFrame."""
+        """Streams and parses a single CSV blob into a DataFrame."""
         try:
-            content = blob.download_as_text()
-            dataframe = pd.read_csv(io.StringIO(content))
+            # Parsing straight from the binary download stream avoids holding
+            # the whole file as bytes and again as a decoded string.
+            with blob.open("rb", retry=_GCS_RETRY) as stream:
+                dataframe = pd.read_csv(stream)
             logger.debug("Loaded %s: %d rows.", blob.name, len(dataframe))
             return dataframe
         except (pd.errors.ParserError, ValueError) as exception:
@@ -279,17 +377,29 @@ class GCSDataLoader(DataLoader):
             return None
 
     def _log_summary(self, data_frames: Dict[str, pd.DataFrame]):
-        """Logs a summary of the loaded data."""
+        """Logs a summary of the loaded data.
+
+        Nothing is computed unless INFO logging is enabled. Memory is
+        reported from the column buffers only; the slow deep measurement,
+        which visits every Python string, is made only at DEBUG level.
+        """
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        deep_memory = logger.isEnabledFor(logging.DEBUG)
         summary_lines = ["\n" + "=" * 60, "DATA LOADING SUMMARY", "=" * 60]
         for data_type, dataframe in data_frames.items():
             if isinstance(dataframe, pd.DataFrame):
                 summary_lines.append(f"\n{data_type.upper()}:")
                 summary_lines.append(f"  - Rows: {len(dataframe):,}")
-                summary_lines.append(f"  - Columns: {len(dataframe.columns)}")
-                mem_mb = dataframe.memory_usage(deep=True).sum() / 1024**2
-                summary_lines.append(f"  - Memory: {mem_mb:.2f} MB")
+                num_columns = len(dataframe.columns)
+                summary_lines.append(f"  - Columns: {num_columns}")
+                mem_mb = dataframe.memory_usage(deep=deep_memory).sum() / 1024**2
+                summary_lines.append(
+                    f"  - Memory: {mem_mb:.2f} MB"
+                    + ("" if deep_memory else " (excluding string contents)")
+                )
                 cols = list(dataframe.columns)[:5]
-                if len(dataframe.columns) > 5:
+                if num_columns > 5:
                     cols.append("...")
                 summary_lines.append(f"  - Columns: {', '.join(cols)}")
         summary_lines.append("\n" + "=" * 60)
@@ -309,17 +419,17 @@ class GCSDataLoader(DataLoader):
             logger.warning("GCS client not available. Report saved locally only.")
             return False
 
-        safe_filename = os.path.basename(filename)
-        if safe_filename != filename:
+        if not _SAFE_FILENAME.fullmatch(filename):
             logger.warning("Invalid filename detected: %s", filename)
             return False
 
         try:
-            reports_path = "reports/cfo_dashboard"
-            blob_path = str(Path(reports_path) / safe_filename)
+            blob_path = REPORTS_PREFIX + filename
             bucket = self.storage_client.bucket(self.bucket_name)
             blob = bucket.blob(blob_path)
-            blob.upload_from_filename(local_path)
+            # Re-uploading the same report is idempotent, so transient errors are
+            # retried even though no generation precondition is set.
+            blob.upload_from_filename(local_path, retry=_GCS_RETRY)
             logger.info("Report uploaded to gs://%s/%s", self.bucket_name, blob_path)
             return True
         except (google.api_core.exceptions.GoogleAPICallError, OSError) as exception:
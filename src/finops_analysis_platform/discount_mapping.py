@@ -1,13 +1,116 @@
 """Manages mapping of GCP machine types to their respective discount rates."""
 
+import functools
 import logging
+import os
+import re
 from pathlib import Path
-from typing import Dict, Optional, cast
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
 
+import numpy as np
+import pandas as pd
 import yaml
 
 logger = logging.getLogger(__name__)
 
+# Column order of the discount rate matrix.
+DISCOUNT_TYPES = ("1yr_resource", "3yr_resource", "1yr_flex", "3yr_flex")
+
+# Column headers of the reference table, aligned with DISCOUNT_TYPES + SUD.
+REFERENCE_TABLE_COLUMNS = (
+    "1-Yr Resource",
+    "3-Yr Resource",
+    "1-Yr Flex",
+    "3-Yr Flex",
+    "SUD",
+)
+
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_discounts_cached(
+    file_path: str, mtime_ns: int, size: int
+) -> Mapping[str, Any]:
+    """Parses a discount mapping file, memoized per path and file version.
+
+    The modification time and size are part of the cache key so that an
+    edited file is re-read. The parsed document is shared between mapping
+    instances, so it is returned as a read-only view; instances copy the
+    sections they keep.
+    """
+    del mtime_ns, size  # Only used as part of the cache key.
+    with open(file_path, "r", encoding="utf-8") as file_handle:
+        return MappingProxyType(yaml.load(file_handle, Loader=_YAML_LOADER) or {})
+
+
+@functools.lru_cache(maxsize=8)
+def _build_prefix_index(
+    prefixes: tuple[str, ...],
+) -> tuple[Optional[re.Pattern], tuple[tuple[int, frozenset[str]], ...]]:
+    """Builds the prefix lookup structures, shared by identical mappings.
+
+    Returns a compiled pattern anchored at the start of the string that
+    matches any prefix (None if there are none), and the prefixes bucketed
+    by length, longest first: a lookup is then one slice and one set probe
+    per distinct length instead of a full scan.
+    """
+    pattern = (
+        re.compile("^(" + "|".join(map(re.escape, prefixes)) + ")")
+        if prefixes
+        else None
+    )
+    by_length = tuple(
+        (length, frozenset(p for p in prefixes if len(p) == length))
+        for length in sorted({len(p) for p in prefixes}, reverse=True)
+    )
+    return pattern, by_length
+
+
+# Billing SKU descriptions that do not start with a machine series, e.g.
+# "Nvidia Tesla T4 GPU running in Americas" or "Local SSD provisioned space".
+_GPU_MODEL_PATTERN = re.compile(r"\b(l4|t4|p4|v100|a100|h100)\b")
+_SPECIAL_SERVICES = (("vmware engine", "gcve"), ("local ssd", "local-ssd"))
+
+
+def _resolve_unprefixed(machine_type: str) -> str:
+    """Resolves a lowercased machine type that matched no known prefix."""
+    if "gpu" in machine_type:
+        gpu_model = _GPU_MODEL_PATTERN.search(machine_type)
+        if gpu_model:
+            return f"gpu-{gpu_model.group(1)}"
+    for marker, base in _SPECIAL_SERVICES:
+        if marker in machine_type:
+            return base
+
+    # Fallback for machine types not explicitly in prefixes (like 'n1')
+    parts = machine_type.split("-")
+    if parts:
+        return parts[0]
+
+    logger.debug(
+        "Could not determine base type for '%s', defaulting to 'n2'.", machine_type
+    )
+    return "n2"
+
+
+@functools.lru_cache(maxsize=8192)
+def _extract_machine_base_cached(
+    machine_type: str, prefixes_by_length: tuple[tuple[int, frozenset[str]], ...]
+) -> str:
+    """Resolves a lowercased machine type to its base type.
+
+    Billing exports repeat a small set of SKU strings many times, so results
+    are memoized; all arguments are hashable and the lookup is pure.
+    """
+    for length, prefixes in prefixes_by_length:
+        head = machine_type[:length]
+        if head in prefixes:
+            return head
+    return _resolve_unprefixed(machine_type)
+
 
 class MachineTypeDiscountMapping:
     """
@@ -18,50 +121,204 @@ class MachineTypeDiscountMapping:
         """Initializes the discount mapping from a YAML configuration file."""
         if config_path is None:
             config_path = Path(__file__).parent / "config" / "machine_discounts.yaml"
-        config = self._load_discounts(str(config_path))
-        self.discounts = cast(Dict[str, Dict[str, float]], config.get("discounts", {}))
-        self.prefixes: list[str] = list(self.discounts.keys())
-        self.families = cast(Dict[str, list[str]], config.get("families", {}))
+        self.config_path = Path(config_path)
+        self._load_mapping()
+
+    def _load_mapping(self):
+        """Builds the lookup structures from the current mapping file."""
+        self.loaded_version = self.file_version()
+        config = self._load_discounts(str(self.config_path))
+        # Per-instance copies, so mutating one mapping cannot leak into the
+        # parse cache shared with every other instance.
+        self.discounts: Dict[str, Dict[str, float]] = {
+            name: dict(rates or {})
+            for name, rates in (config.get("discounts") or {}).items()
+        }
+        # Longest prefixes first so that e.g. 'n2d' wins over 'n2'.
+        self.prefixes: list[str] = sorted(self.discounts, key=len, reverse=True)
+        self._prefix_pattern, self._prefixes_by_length = _build_prefix_index(
+            tuple(self.prefixes)
+        )
+        self.families: Dict[str, list[str]] = {
+            family: list(bases or [])
+            for family, bases in (config.get("families") or {}).items()
+        }
+        # Reverse index so a family lookup is a single dict probe. The first
+        # family listing a base type wins, as with the original linear scan.
+        self._family_of_base: Dict[str, str] = {}
+        for family, bases in self.families.items():
+            for base in bases:
+                self._family_of_base.setdefault(base, family)
+        # Structure-of-arrays view of the discount table: one row per base
+        # type, one column per entry of DISCOUNT_TYPES. A trailing zero row is
+        # selected by index -1 for machine types without discounts.
+        self._machine_index = {name: i for i, name in enumerate(self.discounts)}
+        self._rates = np.array(
+            [
+                [(rates or {}).get(key) or 0.0 for key in DISCOUNT_TYPES]
+                for rates in self.discounts.values()
+            ]
+            + [[0.0] * len(DISCOUNT_TYPES)],
+            dtype=np.float64,
+        )
+
+    def file_version(self) -> Optional[Tuple[int, int]]:
+        """Returns the (mtime_ns, size) of the mapping file, or None if missing."""
+        try:
+            stat = os.stat(self.config_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
 
-    def _load_discounts(self, file_path: str) -> Dict:
-        """Loads the machine discounts from a YAML file."""
+    def reload_if_changed(self) -> bool:
+        """Re-reads the mapping file if it changed since it was loaded.
+
+        Returns:
+            True if the mapping was reloaded.
+        """
+        if self.file_version() == self.loaded_version:
+            return False
+        logger.info("Discount mapping %s changed; reloading.", self.config_path)
+        self._load_mapping()
+        return True
+
+    def _load_discounts(self, file_path: str) -> Mapping[str, Any]:
+        """Loads the machine discounts from a YAML file, parsing it once."""
         try:
-            with open(file_path, "r", encoding="utf-8") as file_handle:
-                return yaml.safe_load(file_handle) or {}
+            stat = os.stat(file_path)
+            return _load_discounts_cached(file_path, stat.st_mtime_ns, stat.st_size)
         except (FileNotFoundError, yaml.YAMLError) as exception:
             logger.error("Failed to load discount mapping file: %s", exception)
             return {}
 
     def get_discount(self, machine_type: str, discount_type: str) -> Optional[float]:
         """Gets the discount for a given machine type and discount type."""
-        machine_base = self._extract_machine_base(machine_type)
-        return self.discounts.get(machine_base, {}).get(discount_type)
+        return self.get_discount_by_base(
+            self._extract_machine_base(machine_type), discount_type
+        )
+
+    def get_discount_by_base(
+        self, machine_base: str, discount_type: str
+    ) -> Optional[float]:
+        """Gets the discount for an already extracted base machine type."""
+        return (self.discounts.get(machine_base) or {}).get(discount_type)
+
+    def get_discount_matrix(self, machine_types: Iterable[str]) -> np.ndarray:
+        """Gets the discount rates for many machine types at once.
+
+        Args:
+            machine_types: The machine types (or SKU descriptions) to look up.
+
+        Returns:
+            An (N, len(DISCOUNT_TYPES)) float array of discount rates, with
+            zeros where a machine type or discount type is not available.
+        """
+        return self.get_discount_matrix_by_base(
+            self._extract_machine_base(machine_type) for machine_type in machine_types
+        )
+
+    def get_discount_matrix_by_base(self, machine_bases: Iterable[str]) -> np.ndarray:
+        """Gets the discount rates for already extracted base machine types.
+
+        Args:
+            machine_bases: Base machine types, e.g. the keys returned by
+                `SpendAnalyzer.analyze_machine_distribution`.
+
+        Returns:
+            An (N, len(DISCOUNT_TYPES)) float array, as for
+            `get_discount_matrix`.
+        """
+        indices = np.fromiter(
+            (self._machine_index.get(base, -1) for base in machine_bases),
+            dtype=np.intp,
+        )
+        return self._rates[indices]
 
     def _extract_machine_base(self, machine_type: str) -> str:
         """Extracts the base machine type from a full SKU description."""
-        machine_type = machine_type.lower()
-        for prefix in self.prefixes:
-            if machine_type.startswith(prefix):
-                return prefix
-
-        # Fallback for machine types not explicitly in prefixes (like 'n1')
-        parts = machine_type.split("-")
-        if parts:
-            return parts[0]
-
-        logger.debug(
-            "Could not determine base type for '%s', defaulting to 'n2'.", machine_type
+        return _extract_machine_base_cached(
+            machine_type.lower(), self._prefixes_by_length
         )
-        return "n2"
 
     def get_machine_base(self, machine_type: str) -> str:
         """Public method to get machine base type."""
         return self._extract_machine_base(machine_type)
 
+    @staticmethod
+    def base_cache_info() -> "functools._CacheInfo":
+        """Reports hit/miss statistics of the shared base-type lookup cache.
+
+        The cache is LRU-bounded, so SKU descriptions with a long tail of
+        unique values cannot grow it without limit; a low hit rate suggests
+        the bound is too small for the workload.
+        """
+        return _extract_machine_base_cached.cache_info()
+
+    def extract_machine_base_series(self, machine_types: pd.Series) -> pd.Series:
+        """Extracts the base machine type for a whole column in one pass.
+
+        This is the vectorized equivalent of `get_machine_base`: the column is
+        lowercased once and matched against a single compiled prefix pattern.
+        Only values without a known prefix fall back to the scalar rules
+        (GPU and special-service SKUs, then the first '-'-separated token),
+        once per distinct value.
+
+        Args:
+            machine_types: A Series of machine types or SKU descriptions.
+
+        Returns:
+            A Series of base machine types aligned with the input index.
+        """
+        lowered = machine_types.astype(str).str.lower()
+        if self._prefix_pattern is None:
+            bases = pd.Series(np.nan, index=lowered.index, dtype=object)
+        else:
+            bases = lowered.str.extract(self._prefix_pattern, expand=False)
+        unmatched = bases.isna()
+        if unmatched.any():
+            fallback = {
+                value: _resolve_unprefixed(value)
+                for value in lowered[unmatched].unique()
+            }
+            bases[unmatched] = lowered[unmatched].map(fallback)
+        return bases
+
     def get_family(self, machine_type: str) -> str:
         """Gets the machine family for a given machine type."""
-        machine_base = self._extract_machine_base(machine_type)
-        for family, types in self.families.items():
-            if machine_base in types:
-                return family
-        return "General Purpose"
+        return self.get_family_by_base(self._extract_machine_base(machine_type))
+
+    def get_family_by_base(self, machine_base: str) -> str:
+        """Gets the machine family for an already extracted base machine type."""
+        return self._family_of_base.get(machine_base, "General Purpose")
+
+    def build_reference_table(self) -> pd.DataFrame:
+        """Builds a display table of discount rates for every base type.
+
+        Rates are formatted as whole percentages column by column; rates that
+        are missing or zero are shown as "N/A".
+
+        Returns:
+            A DataFrame indexed by the upper-cased base machine type with a
+            `Family` column followed by `REFERENCE_TABLE_COLUMNS`.
+        """
+        sud = np.array(
+            [(rates or {}).get("sud") or 0.0 for rates in self.discounts.values()],
+            dtype=np.float64,
+        )
+        matrix = np.column_stack([self._rates[:-1], sud])
+        percentages = np.char.add(
+            np.rint(matrix * 100).astype(np.int64).astype(str), "%"
+        )
+        table = pd.DataFrame(
+            np.where(matrix > 0, percentages, "N/A"),
+            index=pd.Index(
+                [name.upper() for name in self.discounts], name="Machine Type"
+            ),
+            columns=list(REFERENCE_TABLE_COLUMNS),
+        )
+        table.insert(
+            0,
+            "Family",
+            [self.get_family_by_base(name) for name in self.discounts],
+        )
+        return table
@@ -72,6 +72,8 @@ class AnalysisResults:
         ai_portfolio_recommendation: The portfolio recommendation from the AI.
         advanced_analytics: Results from advanced quantitative modeling.
         active_assist_summary: A summary of savings from Active Assist.
+        total_savings_summary: Total monthly savings per CUD type, plus the
+            `optimal_mix` of the best option for each machine type.
     """
 
     machine_spend_distribution: Dict[str, float]
@@ -83,3 +85,4 @@ class AnalysisResults:
     ai_portfolio_recommendation: Optional[Dict[str, Any]] = None
     advanced_analytics: Optional[Dict[str, Any]] = None
     active_assist_summary: Optional[Dict[str, float]] = None
+    total_savings_summary: Optional[Dict[str, float]] = None
@@ -1,14 +1,30 @@
+import hashlib
 import json
 import logging
+import os
+import tempfile
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Protocol, cast
+from typing import Any, Dict, List, Optional, Protocol, Tuple, Union
+
+import numpy as np
+import pandas as pd
 
 from .config_manager import ConfigManager
+from .discount_mapping import DISCOUNT_TYPES
 from .gemini_service import generate_content
 from .models import PortfolioLayer, PortfolioRecommendation
+from .savings_calculator import SAVINGS_COLUMNS
 
 logger = logging.getLogger(__name__)
 
+# Machine types below this monthly spend (USD) are left out of the AI prompt.
+MIN_PROMPT_MONTHLY_SPEND = 1.0
+
+# Number of distinct prompts whose AI responses are kept in memory.
+AI_RESPONSE_MEMO_SIZE = 16
+
 
 class PortfolioRecommender(Protocol):
     """Protocol for portfolio recommenders."""
@@ -31,49 +47,96 @@ class PortfolioRecommender(Protocol):
 class RuleBasedPortfolioRecommender(PortfolioRecommender):
     """Generates a portfolio recommendation based on predefined rules."""
 
-    def recommend_portfolio(self, savings_by_machine: Dict) -> PortfolioRecommendation:
+    def recommend_portfolio(
+        self, savings_by_machine: Union[Dict, pd.DataFrame]
+    ) -> PortfolioRecommendation:
         """Generates a simple, rule-based portfolio recommendation.
 
         This method selects the CUD option with the highest monthly savings for
-        each machine type and aggregates them into a portfolio.
+        each machine type and aggregates them into a portfolio. The input is
+        viewed as a spend vector and a savings matrix (machine types x
+        options); selection and totals are then computed with array
+        reductions.
 
         Args:
             savings_by_machine: A dictionary containing potential savings for
-                each machine type.
+                each machine type, or the equivalent frame from
+                `SavingsCalculator.calculate_savings_frame`.
 
         Returns:
             A `PortfolioRecommendation` object detailing the optimal portfolio.
         """
-        layers = []
-        for machine_type, savings in savings_by_machine.items():
-            current_options = savings["savings_options"]
-            best_option = max(
-                current_options,
-                key=lambda k: cast(Dict[str, float], current_options[k])[
-                    "monthly_savings"
-                ],
+        if isinstance(savings_by_machine, pd.DataFrame):
+            machine_types = savings_by_machine.index.tolist()
+            options = list(DISCOUNT_TYPES)
+            spend = savings_by_machine["monthly_spend"].to_numpy(dtype=np.float64)
+            stable = savings_by_machine["stable_workload"].tolist()
+            savings_matrix = savings_by_machine[list(SAVINGS_COLUMNS)].to_numpy(
+                dtype=np.float64
+            )
+        else:
+            machine_types, options, spend, stable, savings_matrix = (
+                self._arrays_from_dict(savings_by_machine)
             )
-            if current_options[best_option]["monthly_savings"] > 0:
+
+        layers = []
+        total_savings = 0.0
+        if savings_matrix.size:
+            best_idx = savings_matrix.argmax(axis=1)
+            best_savings = savings_matrix[np.arange(len(machine_types)), best_idx]
+            selected = np.flatnonzero(best_savings > 0)
+            total_savings = float(best_savings[selected].sum())
+            # Highest savings first; the stable sort keeps input order on ties.
+            selected = selected[np.argsort(-best_savings[selected], kind="stable")]
+            for row in selected.tolist():
                 layers.append(
                     PortfolioLayer(
-                        machine_type=machine_type,
-                        strategy=best_option,
-                        monthly_spend=savings["stable_workload"],
-                        monthly_savings=current_options[best_option]["monthly_savings"],
+                        machine_type=machine_types[row],
+                        strategy=options[best_idx[row]],
+                        monthly_spend=stable[row],
+                        monthly_savings=float(best_savings[row]),
                     )
                 )
 
-        total_savings = sum(layer.monthly_savings for layer in layers)
-        total_spend = sum(s["monthly_spend"] for s in savings_by_machine.values())
+        total_spend = float(spend.sum())
 
         coverage = (total_savings / total_spend * 100) if total_spend > 0 else 0
         return PortfolioRecommendation(
-            layers=sorted(layers, key=lambda x: x.monthly_savings, reverse=True),
+            layers=layers,
             total_monthly_savings=total_savings,
             total_annual_savings=total_savings * 12,
             coverage_percentage=coverage,
         )
 
+    @staticmethod
+    def _arrays_from_dict(
+        savings_by_machine: Dict,
+    ) -> Tuple[List[str], List[str], np.ndarray, List[Any], np.ndarray]:
+        """Reads the nested savings dictionary into arrays in a single pass.
+
+        Options missing for a machine type are filled with -inf so that they
+        are never selected.
+        """
+        machine_types = list(savings_by_machine)
+        options = list(
+            dict.fromkeys(
+                option
+                for savings in savings_by_machine.values()
+                for option in savings["savings_options"]
+            )
+        )
+        option_index = {option: i for i, option in enumerate(options)}
+
+        spend = np.empty(len(machine_types), dtype=np.float64)
+        stable = []
+        savings_matrix = np.full((len(machine_types), len(options)), -np.inf)
+        for row, savings in enumerate(savings_by_machine.values()):
+            spend[row] = savings["monthly_spend"]
+            stable.append(savings["stable_workload"])
+            for option, values in savings["savings_options"].items():
+                savings_matrix[row, option_index[option]] = values["monthly_savings"]
+        return machine_types, options, spend, stable, savings_matrix
+
 
 class AIPortfolioRecommender(PortfolioRecommender):
     """Generates a CUD portfolio optimization using the Gemini AI."""
@@ -85,6 +148,10 @@ class AIPortfolioRecommender(PortfolioRecommender):
             config_manager: The application's configuration manager.
         """
         self.config_manager = config_manager
+        # (stored-at time, raw response text) keyed by prompt digest, oldest
+        # first. Only successfully parsed responses are stored, so failures
+        # are retried.
+        self._response_memo: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
 
     def recommend_portfolio(self, savings_by_machine: Dict) -> Dict[str, Any]:
         """Generates a CUD portfolio optimization using the Gemini AI.
@@ -97,8 +164,9 @@ class AIPortfolioRecommender(PortfolioRecommender):
             A dictionary containing the AI's portfolio recommendation, or an
             error message if the generation fails.
         """
-        project_id = self.config_manager.get("gcp.project_id")
-        location = self.config_manager.get("gcp.location", "us-central1")
+        settings = self.config_manager.settings
+        project_id = settings.gcp.project_id
+        location = settings.gcp.location
 
         if not project_id:
             logger.warning(
@@ -106,12 +174,21 @@ class AIPortfolioRecommender(PortfolioRecommender):
             )
             return {}
 
-        risk_tolerance = self.config_manager.get("analysis.risk_tolerance", "medium")
+        risk_tolerance = settings.analysis.risk_tolerance
+        # Whole cents are plenty of precision for the model, and sub-dollar
+        # machine types cannot carry a commitment; both only cost tokens.
         spend_data = {
-            mt: {"monthly_spend": data["monthly_spend"], "family": data["family"]}
+            mt: {
+                "monthly_spend": round(float(data["monthly_spend"]), 2),
+                "family": data["family"],
+            }
             for mt, data in savings_by_machine.items()
+            if data["monthly_spend"] >= MIN_PROMPT_MONTHLY_SPEND
         }
-        spend_data_json = json.dumps(spend_data, indent=2)
+        if not spend_data:
+            logger.info("Skipping AI portfolio: no machine type has billable spend.")
+            return {}
+        spend_data_json = json.dumps(spend_data, separators=(",", ":"))
 
         prompt_path = Path(__file__).parent / "prompts" / "portfolio_optimization.txt"
         with open(prompt_path, "r", encoding="utf-8") as prompt_file:
@@ -121,6 +198,21 @@ class AIPortfolioRecommender(PortfolioRecommender):
             risk_tolerance=risk_tolerance.upper(), spend_data_json=spend_data_json
         )
 
+        advanced = settings.advanced
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        memoized = self._recall_response(digest, advanced.ai_cache_ttl_seconds)
+        if memoized is not None:
+            logger.info("Reusing the AI CUD portfolio for an unchanged prompt.")
+            return json.loads(memoized)
+
+        cache_path = None
+        if advanced.ai_cache_dir and advanced.ai_cache_ttl_seconds > 0:
+            cache_path = Path(advanced.ai_cache_dir).expanduser() / f"{digest}.json"
+            cached = _read_cached_response(cache_path, advanced.ai_cache_ttl_seconds)
+            if cached is not None:
+                logger.info("Using cached AI CUD portfolio from %s", cache_path)
+                return cached
+
         logger.info(
             "Generating AI CUD portfolio for risk tolerance: %s", risk_tolerance
         )
@@ -131,10 +223,60 @@ class AIPortfolioRecommender(PortfolioRecommender):
         if not (response and response.text):
             return {"error": "No response from AI for portfolio optimization."}
         try:
-            return json.loads(response.text)
+            portfolio = json.loads(response.text)
         except json.JSONDecodeError:
             logger.error("Failed to decode Gemini's portfolio recommendation.")
             return {
                 "error": "Failed to parse AI response.",
                 "raw_response": response.text,
             }
+        if advanced.ai_cache_ttl_seconds > 0:
+            self._remember_response(digest, response.text)
+        if cache_path is not None:
+            _write_cached_response(cache_path, response.text)
+        return portfolio
+
+    def _recall_response(self, digest: str, ttl_seconds: int) -> Optional[str]:
+        """Returns a memoized response younger than `ttl_seconds`, if any."""
+        entry = self._response_memo.get(digest)
+        if entry is None:
+            return None
+        stored_at, response_text = entry
+        if time.time() - stored_at > ttl_seconds:
+            del self._response_memo[digest]
+            return None
+        self._response_memo.move_to_end(digest)
+        return response_text
+
+    def _remember_response(self, digest: str, response_text: str):
+        """Stores a response in the in-memory memo, evicting the oldest."""
+        self._response_memo[digest] = (time.time(), response_text)
+        self._response_memo.move_to_end(digest)
+        while len(self._response_memo) > AI_RESPONSE_MEMO_SIZE:
+            self._response_memo.popitem(last=False)
+
+
+def _read_cached_response(cache_path: Path, ttl_seconds: int) -> Optional[Any]:
+    """Returns a cached, parsed AI response if it exists and is fresh enough."""
+    try:
+        if time.time() - cache_path.stat().st_mtime > ttl_seconds:
+            return None
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as exception:
+        logger.warning("Ignoring unreadable AI response cache: %s", exception)
+        return None
+
+
+def _write_cached_response(cache_path: Path, response_text: str):
+    """Atomically writes a raw AI response to the cache."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=cache_path.parent, delete=False
+        ) as temp_file:
+            temp_file.write(response_text)
+        os.replace(temp_file.name, cache_path)
+    except OSError as exception:
+        logger.warning("Could not write AI response cache: %s", exception)
@@ -27,6 +27,7 @@ from reportlab.platypus import (
 )
 
 from .config_manager import ConfigManager
+from .discount_mapping import DISCOUNT_TYPES, REFERENCE_TABLE_COLUMNS
 from .models import AnalysisResults
 
 logger = logging.getLogger(__name__)
@@ -58,18 +59,25 @@ def create_dashboard(analysis: AnalysisResults, config_manager: ConfigManager):
     )
 
     # 1. Savings by Strategy
-    # This part needs to be adapted as total_savings_summary is not in the model
-    # For now, we will use the portfolio recommendation total savings
-    savings_summary = analysis.portfolio_recommendation.total_monthly_savings
-    strategies = ["Optimal Mix (Rule-Based)"]
-    savings = [savings_summary]
+    savings_summary = analysis.total_savings_summary or {}
+    strategy_labels = [
+        (label, savings_summary[key])
+        for key, label in zip(DISCOUNT_TYPES, REFERENCE_TABLE_COLUMNS)
+        if key in savings_summary
+    ]
+    strategies = [label for label, _ in strategy_labels]
+    savings = [total for _, total in strategy_labels]
+    colors_by_bar = [theme["primary"]] * len(savings)
+    strategies.append("Optimal Mix (Rule-Based)")
+    savings.append(analysis.portfolio_recommendation.total_monthly_savings)
+    colors_by_bar.append(theme["danger"])
     fig.add_trace(
         go.Bar(
             x=strategies,
             y=savings,
             text=[f"${s:,.0f}" for s in savings],
             textposition="auto",
-            marker_color=[theme["danger"]],
+            marker_color=colors_by_bar,
         ),
         row=1,
         col=1,
@@ -188,13 +196,14 @@ class PDFReportGenerator:
         Returns:
             The filename of the generated report.
         """
+        generated_at = datetime.now()
         if not filename:
-            filename = f"CFO_CUD_Report_{datetime.now().strftime('%Y%m%d')}.pdf"
+            filename = f"CFO_CUD_Report_{generated_at.strftime('%Y%m%d')}.pdf"
 
         doc = SimpleDocTemplate(filename, pagesize=letter)
         story: List[Any] = []
 
-        self._build_title_page(story)
+        self._build_title_page(story, generated_at)
         self._build_executive_summary(story, analysis)
         story.append(PageBreak())
         self._build_portfolio_recommendation(story, analysis)
@@ -207,7 +216,7 @@ class PDFReportGenerator:
         logger.info("PDF Report generated: %s", filename)
         return filename
 
-    def _build_title_page(self, story: List[Any]):
+    def _build_title_page(self, story: List[Any], generated_at: datetime):
         """Builds the title page of the report."""
         logo_path = self.config_manager.get("reporting.company_logo_path")
         if logo_path and Path(logo_path).is_file():
@@ -224,7 +233,7 @@ class PDFReportGenerator:
         story.append(Spacer(1, 12))
         story.append(
             Paragraph(
-                f"Generated: {datetime.now().strftime('%B %d, %Y')}",
+                f"Generated: {generated_at.strftime('%B %d, %Y')}",
                 self.styles["Normal"],
             )
         )
@@ -1,14 +1,41 @@
 """Assesses CUD portfolio risk based on machine type stability."""
 
-from typing import Dict
+from typing import Dict, Union
+
+import numpy as np
+import pandas as pd
 
 from .models import RiskAssessment
 
+RISK_TIERS = ("low", "medium", "high")
+
+# Machine type prefixes of specialized accelerator/HPC (high-risk) and stable
+# compute- or memory-optimized (low-risk) series. Everything else is medium.
+_HIGH_RISK_PREFIXES = ("gpu", "a2", "a3", "g2", "h3")
+_LOW_RISK_PREFIXES = ("m", "c")
+
 
 class RiskAssessor:
     """Assesses portfolio risk based on machine type stability."""
 
-    def assess_risk(self, savings_by_machine: Dict) -> RiskAssessment:
+    @staticmethod
+    def classify_machine_types(machine_types: pd.Series) -> np.ndarray:
+        """Maps each machine type to an index into `RISK_TIERS`.
+
+        Args:
+            machine_types: The machine type names to classify.
+
+        Returns:
+            An integer array with one risk tier index per machine type.
+        """
+        names = machine_types.astype(str).str.lower()
+        high = names.str.startswith(_HIGH_RISK_PREFIXES).to_numpy(dtype=bool)
+        low = names.str.startswith(_LOW_RISK_PREFIXES).to_numpy(dtype=bool)
+        return np.select([high, low], [2, 0], default=1)
+
+    def assess_risk(
+        self, savings_by_machine: Union[Dict, pd.DataFrame]
+    ) -> RiskAssessment:
         """Assesses the portfolio risk based on machine type stability.
 
         This method uses a simple heuristic to categorize spend into low,
@@ -17,20 +44,26 @@ class RiskAssessor:
 
         Args:
             savings_by_machine: A dictionary containing potential savings and
-                spend for each machine type.
+                spend for each machine type, or the equivalent frame from
+                `SavingsCalculator.calculate_savings_frame`.
 
         Returns:
             A `RiskAssessment` object with the overall risk and recommendation.
         """
-        risk_levels = {"low": 0.0, "medium": 0.0, "high": 0.0}
-        for machine_type, savings in savings_by_machine.items():
-            spend = savings["monthly_spend"]
-            if "m" in machine_type or "c" in machine_type:
-                risk_levels["low"] += spend
-            elif "gpu" in machine_type or "a2" in machine_type:
-                risk_levels["high"] += spend
-            else:
-                risk_levels["medium"] += spend
+        if isinstance(savings_by_machine, pd.DataFrame):
+            machine_types = savings_by_machine.index.to_series()
+            spend = savings_by_machine["monthly_spend"].to_numpy(dtype=float)
+        else:
+            machine_types = pd.Series(list(savings_by_machine), dtype=object)
+            spend = np.fromiter(
+                (s["monthly_spend"] for s in savings_by_machine.values()),
+                dtype=float,
+                count=len(savings_by_machine),
+            )
+
+        tiers = self.classify_machine_types(machine_types)
+        totals = np.bincount(tiers, weights=spend, minlength=len(RISK_TIERS))
+        risk_levels = dict(zip(RISK_TIERS, totals.tolist()))
 
         total_spend = sum(risk_levels.values())
         if total_spend == 0:
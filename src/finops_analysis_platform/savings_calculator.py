@@ -1,9 +1,24 @@
 """Calculates potential CUD savings for each machine type."""
 
-from typing import Any, Dict
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
 
 from .config_manager import ConfigManager
-from .discount_mapping import MachineTypeDiscountMapping
+from .discount_mapping import DISCOUNT_TYPES, MachineTypeDiscountMapping
+
+# Column names of the savings frame, aligned with DISCOUNT_TYPES.
+DISCOUNT_COLUMNS = tuple(f"discount_{key}" for key in DISCOUNT_TYPES)
+SAVINGS_COLUMNS = tuple(f"savings_{key}" for key in DISCOUNT_TYPES)
+
+# Recommendation labels, checked in order against the discount rate matrix.
+RECOMMENDATION_LABELS = (
+    "3-Year Resource CUD (Highest Savings)",
+    "1-Year Resource CUD (Good Savings, Less Commitment)",
+    "3-Year Flex CUD (Good Flexibility)",
+    "1-Year Flex CUD (Maximum Flexibility)",
+)
 
 
 class SavingsCalculator:
@@ -23,6 +38,70 @@ class SavingsCalculator:
         self.config_manager = config_manager
         self.discount_mapping = discount_mapping
 
+    def calculate_savings_frame(self, distribution: Dict[str, float]) -> pd.DataFrame:
+        """Calculates potential savings for each machine type as a DataFrame.
+
+        This is the columnar form of `calculate_savings_by_machine`: one row
+        per machine type and one column per field, so consumers can use
+        column reductions instead of iterating nested dictionaries.
+
+        Args:
+            distribution: A dictionary mapping machine types (or SKU
+                descriptions) to their total monthly spend.
+
+        Returns:
+            A DataFrame indexed by machine type with the columns `family`,
+            `monthly_spend`, `stable_workload`, `DISCOUNT_COLUMNS`,
+            `SAVINGS_COLUMNS` and `recommendation`.
+        """
+        machine_types = pd.Series(list(distribution), dtype=object)
+        bases = self.discount_mapping.extract_machine_base_series(machine_types)
+        return self._build_savings_frame(distribution, bases.tolist())
+
+    def _calculate_savings_frame_by_base(
+        self, distribution: Dict[str, float]
+    ) -> pd.DataFrame:
+        """Calculates the savings frame for a distribution keyed by base type.
+
+        Used for the output of `SpendAnalyzer.analyze_machine_distribution`,
+        whose keys are already base machine types, so they are looked up
+        as-is instead of being extracted again.
+        """
+        return self._build_savings_frame(distribution, list(distribution))
+
+    def _build_savings_frame(
+        self, distribution: Dict[str, float], machine_bases: List[str]
+    ) -> pd.DataFrame:
+        """Builds the savings frame from spend and the base type of each key."""
+        stable_coverage = (
+            self.config_manager.settings.cud_strategy.base_layer_coverage / 100.0
+        )
+
+        machine_types = list(distribution)
+        spend = np.fromiter(
+            distribution.values(), dtype=np.float64, count=len(machine_types)
+        )
+        stable = spend * stable_coverage
+        rates = self.discount_mapping.get_discount_matrix_by_base(machine_bases)
+        savings_matrix = rates * stable[:, None]
+
+        columns: Dict[str, Any] = {
+            "family": [
+                self.discount_mapping.get_family_by_base(machine_base)
+                for machine_base in machine_bases
+            ],
+            "monthly_spend": spend,
+            "stable_workload": stable,
+        }
+        columns.update(zip(DISCOUNT_COLUMNS, rates.T))
+        columns.update(zip(SAVINGS_COLUMNS, savings_matrix.T))
+        columns["recommendation"] = np.asarray(RECOMMENDATION_LABELS, dtype=object)[
+            self._recommendation_indices(rates)
+        ]
+        return pd.DataFrame(
+            columns, index=pd.Index(machine_types, dtype=object, name="machine_type")
+        )
+
     def calculate_savings_by_machine(
         self, distribution: Dict[str, float]
     ) -> Dict[str, Any]:
@@ -39,44 +118,86 @@ class SavingsCalculator:
         Returns:
             A dictionary with detailed savings options for each machine type.
         """
-        savings = {}
-        strategy_config = self.config_manager.get("cud_strategy", {})
-        stable_coverage = strategy_config.get("base_layer_coverage", 40) / 100.0
-
-        for machine_type, monthly_spend in distribution.items():
-            stable_workload = monthly_spend * stable_coverage
-            discounts = {
-                "1yr_resource": self.discount_mapping.get_discount(
-                    machine_type, "1yr_resource"
-                )
-                or 0,
-                "3yr_resource": self.discount_mapping.get_discount(
-                    machine_type, "3yr_resource"
-                )
-                or 0,
-                "1yr_flex": self.discount_mapping.get_discount(machine_type, "1yr_flex")
-                or 0,
-                "3yr_flex": self.discount_mapping.get_discount(machine_type, "3yr_flex")
-                or 0,
-            }
-            savings[machine_type] = {
-                "family": self.discount_mapping.get_family(machine_type),
+        frame = self.calculate_savings_frame(distribution)
+        return self.frame_to_dict(frame)
+
+    @staticmethod
+    def summarize_savings(frame: pd.DataFrame) -> Dict[str, float]:
+        """Totals the monthly savings of a savings frame per CUD type.
+
+        Args:
+            frame: A DataFrame as returned by `calculate_savings_frame`.
+
+        Returns:
+            A dictionary with the total monthly savings for each entry of
+            `DISCOUNT_TYPES` if it were applied to every machine type, plus
+            `optimal_mix`: the total when each machine type uses its best
+            option.
+        """
+        savings_matrix = frame[list(SAVINGS_COLUMNS)].to_numpy(dtype=np.float64)
+        summary = dict(zip(DISCOUNT_TYPES, savings_matrix.sum(axis=0).tolist()))
+        summary["optimal_mix"] = (
+            float(savings_matrix.max(axis=1).sum()) if len(savings_matrix) else 0.0
+        )
+        return summary
+
+    @staticmethod
+    def frame_to_dict(frame: pd.DataFrame) -> Dict[str, Any]:
+        """Converts a savings frame to the nested per-machine dictionary.
+
+        Args:
+            frame: A DataFrame as returned by `calculate_savings_frame`.
+
+        Returns:
+            A dictionary with detailed savings options for each machine type.
+        """
+        rows = zip(
+            frame.index.tolist(),
+            frame["family"].tolist(),
+            frame["monthly_spend"].tolist(),
+            frame["stable_workload"].tolist(),
+            frame[list(DISCOUNT_COLUMNS)].to_numpy().tolist(),
+            frame[list(SAVINGS_COLUMNS)].to_numpy().tolist(),
+            frame["recommendation"].tolist(),
+        )
+        return {
+            machine_type: {
+                "family": family,
                 "monthly_spend": monthly_spend,
                 "stable_workload": stable_workload,
                 "savings_options": {
-                    key: {"discount": value, "monthly_savings": stable_workload * value}
-                    for key, value in discounts.items()
+                    key: {"discount": rate, "monthly_savings": monthly_savings}
+                    for key, rate, monthly_savings in zip(
+                        DISCOUNT_TYPES, rate_row, savings_row
+                    )
                 },
-                "recommendation": self._get_recommendation(discounts),
+                "recommendation": recommendation,
             }
-        return savings
-
-    def _get_recommendation(self, discounts: Dict[str, float]) -> str:
-        """Gets a CUD recommendation based on available discount rates."""
-        if discounts.get("3yr_resource", 0) >= 0.65:
-            return "3-Year Resource CUD (Highest Savings)"
-        if discounts.get("1yr_resource", 0) >= 0.45:
-            return "1-Year Resource CUD (Good Savings, Less Commitment)"
-        if discounts.get("3yr_flex", 0) > 0:
-            return "3-Year Flex CUD (Good Flexibility)"
-        return "1-Year Flex CUD (Maximum Flexibility)"
+            for (
+                machine_type,
+                family,
+                monthly_spend,
+                stable_workload,
+                rate_row,
+                savings_row,
+                recommendation,
+            ) in rows
+        }
+
+    @staticmethod
+    def _recommendation_indices(rates: np.ndarray) -> np.ndarray:
+        """Picks a `RECOMMENDATION_LABELS` index for each row of discount rates.
+
+        Args:
+            rates: An `(N, len(DISCOUNT_TYPES))` discount rate matrix.
+
+        Returns:
+            An integer array of length N.
+        """
+        column = dict(zip(DISCOUNT_TYPES, rates.T))
+        conditions = [
+            column["3yr_resource"] >= 0.65,
+            column["1yr_resource"] >= 0.45,
+            column["3yr_flex"] > 0,
+        ]
+        return np.select(conditions, [0, 1, 2], default=3)
@@ -1,12 +1,17 @@
 """Analyzes spend distribution across different machine types."""
 
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Iterable, Union
 
+import numpy as np
 import pandas as pd
 
 from .data_loader import generate_sample_spend_distribution
 from .discount_mapping import MachineTypeDiscountMapping
 
+# The billing columns used by the analysis: the cost and either SKU column.
+BILLING_COLUMNS = ("SKU", "Sku Description", "Cost")
+
 
 class SpendAnalyzer:
     """Analyzes spend distribution from billing data."""
@@ -37,15 +42,88 @@ class SpendAnalyzer:
         """
         if billing_data is None or billing_data.empty:
             return generate_sample_spend_distribution()
+        return self._aggregate_spend(billing_data)
 
-        sku_col = "SKU" if "SKU" in billing_data.columns else "Sku Description"
-        dataframe = billing_data.copy()
-        dataframe["Cost"] = pd.to_numeric(dataframe["Cost"], errors="coerce")
+    def analyze_machine_distribution_chunks(
+        self, chunks: Iterable[pd.DataFrame]
+    ) -> Dict[str, float]:
+        """Analyzes the spend distribution over billing data read in chunks.
 
-        # Vectorized operation for better performance
-        dataframe["base_type"] = dataframe[sku_col].apply(
-            self.discount_mapping.get_machine_base
-        )
-        distribution = dataframe.groupby("base_type")["Cost"].sum().to_dict()
+        Only the running per-machine-type totals are kept between chunks, so
+        peak memory is bounded by the chunk size rather than the full export.
+
+        Args:
+            chunks: DataFrames with the same columns as required by
+                `analyze_machine_distribution`.
 
+        Returns:
+            A dictionary mapping each base machine type to its total cost, or
+            an empty dictionary if no chunk has any rows. Unlike
+            `analyze_machine_distribution`, no sample data is substituted.
+        """
+        distribution: Dict[str, float] = {}
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+            for base_type, total in self._aggregate_spend(chunk).items():
+                distribution[base_type] = distribution.get(base_type, 0.0) + total
         return distribution
+
+    def analyze_machine_distribution_from_csv(
+        self, csv_path: Union[str, Path], chunksize: int = 1_000_000
+    ) -> Dict[str, float]:
+        """Analyzes the spend distribution of a billing CSV without loading it.
+
+        Only the SKU and cost columns are parsed, `chunksize` rows at a time,
+        with the SKU column read as a categorical.
+
+        Args:
+            csv_path: The path to a billing export CSV file.
+            chunksize: The number of rows to read per chunk.
+
+        Returns:
+            A dictionary mapping each base machine type to its total cost, or
+            an empty dictionary if the file has no rows.
+        """
+        with pd.read_csv(
+            csv_path,
+            usecols=lambda column: column in BILLING_COLUMNS,
+            # SKU strings repeat heavily; the parser stores them as categories
+            # so each chunk holds one copy per distinct SKU plus int codes.
+            dtype={"SKU": "category", "Sku Description": "category"},
+            chunksize=chunksize,
+        ) as reader:
+            return self.analyze_machine_distribution_chunks(reader)
+
+    def _aggregate_spend(self, billing_data: pd.DataFrame) -> Dict[str, float]:
+        """Sums the cost of a non-empty billing frame by base machine type."""
+        sku_col = "SKU" if "SKU" in billing_data.columns else "Sku Description"
+        cost = billing_data["Cost"]
+        if not pd.api.types.is_numeric_dtype(cost):
+            cost = pd.to_numeric(cost, errors="coerce")
+        cost = cost.to_numpy(dtype=np.float64, na_value=np.nan)
+        # Billing exports repeat a few hundred SKUs across many rows, so the
+        # base type is derived once per distinct SKU and rows are summed by
+        # integer code rather than by hashing strings.
+        sku_column = billing_data[sku_col]
+        sku_codes, skus = pd.factorize(sku_column)
+        skus = pd.Series(np.asarray(skus, dtype=object))
+        missing = sku_codes < 0
+        if missing.any():
+            # Missing SKUs keep their string form ('None', 'nan', ...) as
+            # separate keys, as when every SKU was converted to a string.
+            missing_codes, missing_skus = pd.factorize(sku_column[missing].astype(str))
+            sku_codes[missing] = missing_codes + len(skus)
+            skus = pd.concat(
+                [skus, pd.Series(np.asarray(missing_skus, dtype=object))],
+                ignore_index=True,
+            )
+        sku_bases = self.discount_mapping.extract_machine_base_series(skus)
+        base_codes, base_types = pd.factorize(sku_bases)
+        totals = np.bincount(
+            base_codes[sku_codes],
+            # Unparseable costs count as zero; infinities are kept as-is.
+            weights=np.where(np.isnan(cost), 0.0, cost),
+            minlength=len(base_types),
+        )
+        return dict(zip(base_types.tolist(), totals.tolist()))
@@ -65,3 +65,13 @@ def test_profile_command_handles_missing_dataset():
         assert "Invalid value for '--dataset'" in result.output
         # Ensure the report function was NOT called
         mock_create_report.assert_not_called()
+
+
+def test_discounts_command_prints_reference_table():
+    """Test that the 'discounts' command prints the reference table."""
+    runner = CliRunner()
+    result = runner.invoke(main, ["discounts"])
+
+    assert result.exit_code == 0
+    assert "3-Yr Resource" in result.output
+    assert "N2D" in result.output
@@ -57,11 +57,62 @@ analysis:
         )
         self.assertEqual(cm.get("gcp.project_id"), "os-project")
 
+    @patch.dict(os.environ, {"ANALYSIS_FORECAST_MONTHS": "three"})
+    def test_uncastable_env_var_raises(self):
+        """Test that an env var of the wrong type fails with a clear error."""
+        with open(self.test_yaml_path, "a") as f:
+            f.write("  forecast_months: 3\n")
+        with self.assertRaisesRegex(ValueError, "ANALYSIS_FORECAST_MONTHS.*int"):
+            ConfigManager(config_path=str(self.test_yaml_path), env_path=None)
+
+    @patch.dict(os.environ, {"ANALYSIS_CUSTOM_BATCH_SIZE": "large"})
+    def test_uncastable_env_var_outside_schema_keeps_string(self):
+        """Test that env vars for keys outside the schema are passed through."""
+        with open(self.test_yaml_path, "a") as f:
+            f.write("  custom_batch_size: 100\n")
+        cm = ConfigManager(config_path=str(self.test_yaml_path), env_path=None)
+        self.assertEqual(cm.get("analysis.custom_batch_size"), "large")
+
     def test_get_with_default_value(self):
         """Test the get method with a default value for a missing key."""
         cm = ConfigManager(config_path=str(self.test_yaml_path), env_path=None)
         self.assertEqual(cm.get("gcp.nonexistent_key", "default"), "default")
 
+    def test_settings_are_typed(self):
+        """Test that the loaded configuration is exposed as typed settings."""
+        cm = ConfigManager(config_path=str(self.test_yaml_path), env_path=None)
+        self.assertEqual(cm.settings.gcp.project_id, "yaml-project")
+        self.assertEqual(cm.get("cud_strategy.base_layer_coverage"), 40)
+        self.assertIsInstance(cm.get("analysis"), dict)
+
+    def test_section_dict_mutation_is_isolated(self):
+        """Test that mutating a returned section does not leak into later gets."""
+        cm = ConfigManager(config_path=str(self.test_yaml_path), env_path=None)
+        original = cm.get("analysis.risk_tolerance")
+        cm.get("analysis")["risk_tolerance"] = "mutated"
+        self.assertEqual(cm.get("analysis")["risk_tolerance"], original)
+        self.assertEqual(cm.get("analysis.risk_tolerance"), original)
+
+    def test_item_and_leaf_mutation_is_isolated(self):
+        """Test that dict-style items and mutable leaves are returned as copies."""
+        cm = ConfigManager(config_path=str(self.test_yaml_path), env_path=None)
+        cm.config = {
+            "gcp": {"project_id": "yaml-project"},
+            "reporting": {"theme_colors": {"primary": "#000000"}},
+        }
+        cm["gcp"]["project_id"] = "mutated"
+        cm.get("reporting.theme_colors")["primary"] = "#ffffff"
+
+        self.assertEqual(cm["gcp"]["project_id"], "yaml-project")
+        self.assertEqual(cm.get("gcp.project_id"), "yaml-project")
+        self.assertEqual(cm.get("reporting.theme_colors"), {"primary": "#000000"})
+
+    def test_invalid_type_raises(self):
+        """Test that a value of the wrong type is rejected at load time."""
+        cm = ConfigManager(config_path=str(self.test_yaml_path), env_path=None)
+        with self.assertRaises(ValueError):
+            cm.config = {"cud_strategy": {"base_layer_coverage": "forty"}}
+
 
 if __name__ == "__main__":
     unittest.main()
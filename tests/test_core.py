@@ -1,11 +1,15 @@
 import unittest
-from unittest.mock import MagicMock
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 
 from finops_analysis_platform.config_manager import ConfigManager
 from finops_analysis_platform.core import CUDAnalyzer
+from finops_analysis_platform.discount_mapping import MachineTypeDiscountMapping
 from finops_analysis_platform.models import PortfolioRecommendation, RiskAssessment
+from finops_analysis_platform.portfolio_recommender import AIPortfolioRecommender
+from finops_analysis_platform.spend_analyzer import SpendAnalyzer
 
 
 class TestCUDAnalyzer(unittest.TestCase):
@@ -50,7 +54,11 @@ class TestCUDAnalyzer(unittest.TestCase):
             "n1": 300,
             "e2": 50,
         }
-        self.savings_calculator.calculate_savings_by_machine.return_value = {
+        savings_frame = pd.DataFrame({"monthly_spend": [300, 50]}, index=["n1", "e2"])
+        self.savings_calculator._calculate_savings_frame_by_base.return_value = (
+            savings_frame
+        )
+        self.savings_calculator.frame_to_dict.return_value = {
             "n1": {"savings_options": {}},
             "e2": {"savings_options": {}},
         }
@@ -73,6 +81,110 @@ class TestCUDAnalyzer(unittest.TestCase):
         self.assertEqual(analysis.risk_assessment.overall_risk, "LOW")
         self.assertIsNotNone(analysis.ai_portfolio_recommendation)
         self.assertIn("Rightsize VM", analysis.active_assist_summary)
+        self.rule_based_recommender.recommend_portfolio.assert_called_once_with(
+            savings_frame
+        )
+        self.risk_assessor.assess_risk.assert_called_once_with(savings_frame)
+        self.assertEqual(
+            analysis.savings_by_machine,
+            {
+                "n1": {"savings_options": {}},
+                "e2": {"savings_options": {}},
+            },
+        )
+
+    def test_generate_comprehensive_analysis_without_spend(self):
+        """Test that downstream steps are skipped when there is no spend."""
+        self.spend_analyzer.analyze_machine_distribution.return_value = {}
+        self.recommendation_analyzer.analyze.return_value = {}
+
+        analysis = self.analyzer.generate_comprehensive_analysis()
+
+        self.savings_calculator._calculate_savings_frame_by_base.assert_not_called()
+        self.rule_based_recommender.recommend_portfolio.assert_not_called()
+        self.ai_recommender.recommend_portfolio.assert_not_called()
+        self.assertEqual(analysis.savings_by_machine, {})
+        self.assertEqual(analysis.portfolio_recommendation, PortfolioRecommendation())
+        self.assertIsNone(analysis.ai_portfolio_recommendation)
+
+    def test_generate_comprehensive_analysis_without_billing_data(self):
+        """Test that missing billing data skips the steps, not fakes spend."""
+        self.analyzer.spend_analyzer = SpendAnalyzer(MachineTypeDiscountMapping())
+        self.analyzer.billing_data = None
+        self.recommendation_analyzer.analyze.return_value = {}
+
+        analysis = self.analyzer.generate_comprehensive_analysis()
+
+        self.assertEqual(analysis.machine_spend_distribution, {})
+        self.savings_calculator._calculate_savings_frame_by_base.assert_not_called()
+        self.ai_recommender.recommend_portfolio.assert_not_called()
+        self.assertIsNone(analysis.ai_portfolio_recommendation)
+
+    def test_analysis_is_cached_until_inputs_change(self):
+        """Test that unchanged inputs reuse the previous analysis."""
+        self.spend_analyzer.analyze_machine_distribution.return_value = {}
+        self.recommendation_analyzer.analyze.return_value = {}
+
+        first = self.analyzer.generate_comprehensive_analysis()
+        second = self.analyzer.generate_comprehensive_analysis()
+
+        self.assertEqual(first.machine_spend_distribution, {})
+        self.assertIsNot(first, second)
+        self.spend_analyzer.analyze_machine_distribution.assert_called_once()
+
+        self.analyzer.billing_data = self.billing_data.assign(Cost=[1, 2, 3])
+        self.analyzer.generate_comprehensive_analysis()
+        self.assertEqual(self.spend_analyzer.analyze_machine_distribution.call_count, 2)
+
+        self.config_manager.config = {"cud_strategy": {"base_layer_coverage": 50}}
+        self.analyzer.generate_comprehensive_analysis()
+        self.assertEqual(self.spend_analyzer.analyze_machine_distribution.call_count, 3)
+
+    def test_analysis_cache_tracks_discount_mapping_file(self):
+        """Test that editing the discount mapping invalidates the cache."""
+        discounts_path = Path("test_core_discounts.yaml")
+        discounts_path.write_text("discounts:\n  n1: {'1yr_resource': 0.37}\n")
+        self.addCleanup(discounts_path.unlink)
+        mapping = MachineTypeDiscountMapping(config_path=discounts_path)
+        self.savings_calculator.discount_mapping = mapping
+        self.spend_analyzer.analyze_machine_distribution.return_value = {}
+        self.recommendation_analyzer.analyze.return_value = {}
+
+        self.analyzer.generate_comprehensive_analysis()
+        self.analyzer.generate_comprehensive_analysis()
+        self.spend_analyzer.analyze_machine_distribution.assert_called_once()
+
+        discounts_path.write_text("discounts:\n  n1: {'1yr_resource': 0.40}\n")
+        self.analyzer.generate_comprehensive_analysis()
+        self.assertEqual(self.spend_analyzer.analyze_machine_distribution.call_count, 2)
+        self.assertEqual(mapping.get_discount("n1", "1yr_resource"), 0.40)
+
+    @patch("finops_analysis_platform.portfolio_recommender.generate_content")
+    def test_analysis_with_ai_error_is_not_cached(self, mock_generate_content):
+        """Test that a failed AI step is retried on the next analysis."""
+        self.config_manager.config = {"gcp": {"project_id": "test-project"}}
+        self.analyzer.ai_recommender = AIPortfolioRecommender(self.config_manager)
+        self.spend_analyzer.analyze_machine_distribution.return_value = {"n1": 300}
+        self.savings_calculator._calculate_savings_frame_by_base.return_value = (
+            pd.DataFrame({"monthly_spend": [300]}, index=["n1"])
+        )
+        self.savings_calculator.frame_to_dict.return_value = {
+            "n1": {"monthly_spend": 300, "family": "General Purpose"}
+        }
+        self.recommendation_analyzer.analyze.return_value = {}
+        mock_response = MagicMock()
+        mock_response.text = '{"strategy_summary": "ok", "portfolio": []}'
+        mock_generate_content.side_effect = [None, mock_response]
+
+        failed = self.analyzer.generate_comprehensive_analysis()
+        retried = self.analyzer.generate_comprehensive_analysis()
+        cached = self.analyzer.generate_comprehensive_analysis()
+
+        self.assertIn("error", failed.ai_portfolio_recommendation)
+        self.assertEqual(retried.ai_portfolio_recommendation["strategy_summary"], "ok")
+        self.assertEqual(cached.ai_portfolio_recommendation["strategy_summary"], "ok")
+        self.assertEqual(mock_generate_content.call_count, 2)
+        self.assertEqual(self.spend_analyzer.analyze_machine_distribution.call_count, 2)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,22 @@
 """Tests for the Data Loader Module."""
 
+import io
+import logging
 import unittest
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
 from google.auth.exceptions import DefaultCredentialsError
+from google.auth.transport.requests import AuthorizedSession
 
 from finops_analysis_platform.config_manager import ConfigManager
-from finops_analysis_platform.data_loader import GCSDataLoader, get_data_loader
+from finops_analysis_platform.data_loader import (
+    _GCS_RETRY,
+    GCSDataLoader,
+    _default_storage_client,
+    generate_sample_billing_data,
+    get_data_loader,
+)
 
 
 class TestDataLoaders(unittest.TestCase):
@@ -17,6 +26,8 @@ class TestDataLoaders(unittest.TestCase):
         """Set up common objects for tests."""
         self.config_manager = ConfigManager()
         self.config_manager.config = {"gcp": {"bucket_name": "test-bucket"}}
+        _default_storage_client.cache_clear()
+        self.addCleanup(_default_storage_client.cache_clear)
 
     @patch("google.auth.default", side_effect=DefaultCredentialsError)
     def test_gcs_loader_falls_back_to_sample_on_auth_error(self, mock_auth):
@@ -25,6 +36,22 @@ class TestDataLoaders(unittest.TestCase):
         data = loader.load_all_data()
         self.assertTrue(data.get("sample_data"))
 
+    @patch("google.cloud.storage.Client")
+    @patch("google.auth.default")
+    def test_gcs_loaders_share_one_client(self, mock_auth, mock_storage_client):
+        """Test that loaders reuse the authenticated client and credentials."""
+        mock_auth.return_value = (MagicMock(), "test-project")
+
+        first = GCSDataLoader(bucket_name="bucket-a")
+        second = GCSDataLoader(bucket_name="bucket-b")
+
+        self.assertIs(first.storage_client, second.storage_client)
+        mock_auth.assert_called_once()
+        mock_storage_client.assert_called_once()
+        session = mock_storage_client.call_args.kwargs["_http"]
+        self.assertIsInstance(session, AuthorizedSession)
+        self.assertEqual(session.get_adapter("https://")._pool_maxsize, 16)
+
     @patch("google.cloud.storage.Client")
     @patch("google.auth.default")
     def test_gcs_loader_loads_data_successfully(self, mock_auth, mock_storage_client):
@@ -33,10 +60,9 @@ class TestDataLoaders(unittest.TestCase):
         mock_auth.return_value = (MagicMock(), "test-project")
 
         # Mock the GCS client and blobs
-        mock_blob_content = "col1,col2\nval1,val2"
         mock_blob = MagicMock()
         mock_blob.name = "data/billing/test.csv"
-        mock_blob.download_as_text.return_value = mock_blob_content
+        mock_blob.open.return_value = io.BytesIO(b"col1,col2\nval1,val2")
         mock_bucket = MagicMock()
         mock_bucket.list_blobs.return_value = [mock_blob]
         mock_storage_client.return_value.bucket.return_value = mock_bucket
@@ -48,6 +74,121 @@ class TestDataLoaders(unittest.TestCase):
         self.assertIsInstance(data["billing"], pd.DataFrame)
         self.assertEqual(len(data["billing"]), 1)
 
+    @patch("google.cloud.storage.Client")
+    @patch("google.auth.default")
+    def test_gcs_loader_combines_files_in_listing_order(
+        self, mock_auth, mock_storage_client
+    ):
+        """Test that concurrently loaded files are combined in listing order."""
+        mock_auth.return_value = (MagicMock(), "test-project")
+        names = [f"data/billing/part-{index}.csv" for index in range(5)]
+        names[2:2] = ["data/recommendations/recs.csv", "data/archive/old.csv"]
+        blobs = []
+        for index, name in enumerate(names):
+            blob = MagicMock()
+            blob.name = name
+            blob.open.return_value = io.BytesIO(f"col1\n{index}".encode())
+            blobs.append(blob)
+        mock_bucket = MagicMock()
+        mock_bucket.list_blobs.return_value = blobs
+        mock_storage_client.return_value.bucket.return_value = mock_bucket
+
+        data = GCSDataLoader(bucket_name="test-bucket").load_all_data()
+
+        self.assertEqual(data["billing"]["col1"].tolist(), [0, 1, 4, 5, 6])
+        self.assertEqual(data["recommendations"]["col1"].tolist(), [2])
+        blobs[3].open.assert_not_called()
+        mock_bucket.list_blobs.assert_called_once_with(
+            prefix="data/", match_glob="data/**.csv"
+        )
+
+    @patch("google.cloud.storage.Client")
+    @patch("google.auth.default")
+    def test_gcs_loader_streams_csv_chunks(self, mock_auth, mock_storage_client):
+        """Test that billing files are streamed as bounded-size chunks."""
+        mock_auth.return_value = (MagicMock(), "test-project")
+        blobs = []
+        for index, content in enumerate(
+            [b"SKU,Cost\nn2,1\ne2,2\nn2,3", b"SKU,Cost\nc2,4"]
+        ):
+            blob = MagicMock()
+            blob.name = f"data/billing/part-{index}.csv"
+            blob.open.return_value = io.BytesIO(content)
+            blobs.append(blob)
+        mock_bucket = MagicMock()
+        mock_bucket.list_blobs.return_value = blobs
+        mock_storage_client.return_value.bucket.return_value = mock_bucket
+
+        loader = GCSDataLoader(bucket_name="test-bucket")
+        chunks = list(loader.iter_csv_chunks("billing", chunksize=2))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1, 1])
+        self.assertEqual(pd.concat(chunks)["Cost"].tolist(), [1, 2, 3, 4])
+
+    def test_generate_sample_billing_data_costs_follow_machine_type(self):
+        """Test that sample costs use the unit cost of each row's machine type."""
+        billing = generate_sample_billing_data(rows=500)
+        unit_cost = billing["Cost"] / billing["Usage"]
+        gpu = billing["SKU"] == "gpu-t4-instance"
+        e2 = billing["SKU"] == "e2-standard-4"
+
+        self.assertEqual(len(billing), 500)
+        self.assertIsInstance(billing["SKU"].dtype, pd.CategoricalDtype)
+        self.assertEqual(set(billing["Service"]), {"Compute Engine"})
+        self.assertEqual(billing["Service"].cat.codes.dtype, "int8")
+        hours = (billing["End Time"] - billing["Start Time"]).dt.total_seconds() / 3600
+        self.assertTrue(hours.between(1, 23).all())
+        self.assertEqual(str(billing["Start Time"].dt.tz), "UTC")
+        self.assertTrue(unit_cost[gpu].between(2.25, 2.75).all())
+        self.assertTrue(unit_cost[e2].between(0.045, 0.055).all())
+
+    @patch("google.cloud.storage.Client")
+    @patch("google.auth.default")
+    def test_save_report_to_gcs_rejects_unsafe_filenames(
+        self, mock_auth, mock_storage_client
+    ):
+        """Test that only plain file names are uploaded to the reports folder."""
+        mock_auth.return_value = (MagicMock(), "test-project")
+        mock_bucket = mock_storage_client.return_value.bucket.return_value
+        loader = GCSDataLoader(bucket_name="test-bucket")
+
+        for unsafe in ("../report.pdf", "a/report.pdf", "..", "report\x00.pdf", ""):
+            self.assertFalse(loader.save_report_to_gcs(unsafe, "local.pdf"))
+        mock_bucket.blob.assert_not_called()
+
+        self.assertTrue(loader.save_report_to_gcs("CFO_Report.pdf", "local.pdf"))
+        mock_bucket.blob.assert_called_once_with("reports/cfo_dashboard/CFO_Report.pdf")
+        mock_bucket.blob.return_value.upload_from_filename.assert_called_once_with(
+            "local.pdf", retry=_GCS_RETRY
+        )
+
+    @patch("google.cloud.storage.Client")
+    @patch("google.auth.default")
+    def test_log_summary_measures_deep_memory_only_for_debug(
+        self, mock_auth, mock_storage_client
+    ):
+        """Test that the summary skips work unless its log level is enabled."""
+        mock_auth.return_value = (MagicMock(), "test-project")
+        loader = GCSDataLoader(bucket_name="test-bucket")
+        data_frames = {"billing": pd.DataFrame({"SKU": ["n2"], "Cost": [1.0]})}
+        logger = logging.getLogger("finops_analysis_platform.data_loader")
+        self.addCleanup(logger.setLevel, logger.level)
+
+        with patch.object(
+            pd.DataFrame, "memory_usage", return_value=pd.Series([0])
+        ) as mock_memory_usage:
+            logger.setLevel(logging.WARNING)
+            loader._log_summary(data_frames)
+            mock_memory_usage.assert_not_called()
+
+            with self.assertLogs(logger, level="INFO"):
+                loader._log_summary(data_frames)
+            mock_memory_usage.assert_called_once_with(deep=False)
+
+            with self.assertLogs(logger, level="DEBUG"):
+                loader._log_summary(data_frames)
+            mock_memory_usage.assert_called_with(deep=True)
+
     def test_get_data_loader_factory(self):
         """Test the get_data_loader factory function."""
         # Test with a bucket name (should return GCSDataLoader)
@@ -1,7 +1,12 @@
 import unittest
 from pathlib import Path
 
-from finops_analysis_platform.discount_mapping import MachineTypeDiscountMapping
+import pandas as pd
+
+from finops_analysis_platform.discount_mapping import (
+    MachineTypeDiscountMapping,
+    _load_discounts_cached,
+)
 
 
 class TestMachineTypeDiscountMapping(unittest.TestCase):
@@ -57,6 +62,106 @@ prefixes: ['n1', 'e2', 'gpu']
             self.discount_mapping.get_family("c2-standard-8"), "General Purpose"
         )  # default
 
+    def test_extract_machine_base_series(self):
+        """Test that the vectorized extraction matches the scalar lookup."""
+        skus = pd.Series(["N1-standard-4", "gpu-t4-instance", "z3-highmem-8"])
+        bases = self.discount_mapping.extract_machine_base_series(skus)
+        self.assertEqual(bases.tolist(), ["n1", "gpu", "z3"])
+        self.assertEqual(
+            bases.tolist(), [self.discount_mapping.get_machine_base(s) for s in skus]
+        )
+
+    def test_longest_prefix_wins(self):
+        """Test that a longer prefix is preferred over a shorter one."""
+        mapping = MachineTypeDiscountMapping()
+        self.assertEqual(mapping.get_machine_base("n2d-standard-8"), "n2d")
+        self.assertEqual(mapping.get_machine_base("n2-standard-8"), "n2")
+        self.assertEqual(mapping.get_machine_base("c4a-highcpu-4"), "c4a")
+
+    def test_billing_sku_descriptions(self):
+        """Test that GPU and special-service SKU descriptions are recognized."""
+        mapping = MachineTypeDiscountMapping()
+        skus = pd.Series(
+            [
+                "Nvidia Tesla T4 GPU running in Americas",
+                "Local SSD provisioned space",
+                "E2 Instance Core running in Iowa",
+            ]
+        )
+        bases = mapping.extract_machine_base_series(skus)
+        self.assertEqual(bases.tolist(), ["gpu-t4", "local-ssd", "e2"])
+        self.assertEqual(bases.tolist(), [mapping.get_machine_base(s) for s in skus])
+
+    def test_get_discount_matrix(self):
+        """Test that the discount matrix is aligned and zero-filled."""
+        matrix = self.discount_mapping.get_discount_matrix(["n1", "gpu-t4", "z3"])
+        self.assertEqual(matrix.shape, (3, 4))
+        self.assertEqual(matrix[0].tolist(), [0.37, 0.55, 0.28, 0.46])
+        self.assertAlmostEqual(matrix[1][1], 0.40)
+        self.assertEqual(matrix[2].tolist(), [0.0, 0.0, 0.0, 0.0])
+
+    def test_lookups_by_base(self):
+        """Test that the by-base lookups use their key without extraction."""
+        self.assertEqual(
+            self.discount_mapping.get_discount_by_base("gpu", "1yr_flex"), 0.10
+        )
+        self.assertIsNone(
+            self.discount_mapping.get_discount_by_base("gpu-t4", "1yr_flex")
+        )
+        self.assertEqual(self.discount_mapping.get_family_by_base("gpu"), "GPU")
+        matrix = self.discount_mapping.get_discount_matrix_by_base(["e2", "e2-medium"])
+        self.assertEqual(matrix[0].tolist(), [0.37, 0.55, 0.28, 0.46])
+        self.assertEqual(matrix[1].tolist(), [0.0, 0.0, 0.0, 0.0])
+
+    def test_base_cache_info(self):
+        """Test that repeated base lookups are served from the bounded cache."""
+        self.discount_mapping.get_machine_base("N2D-Standard-8 cache probe")
+        before = MachineTypeDiscountMapping.base_cache_info()
+        self.discount_mapping.get_machine_base("N2D-Standard-8 cache probe")
+        after = MachineTypeDiscountMapping.base_cache_info()
+        self.assertEqual(after.hits, before.hits + 1)
+        self.assertEqual(after.maxsize, 8192)
+
+    def test_yaml_parsed_once_per_file_version(self):
+        """Test that instances share the parsed file until it changes."""
+        before = _load_discounts_cached.cache_info()
+        other = MachineTypeDiscountMapping(config_path=self.test_discounts_path)
+        after = _load_discounts_cached.cache_info()
+        self.assertEqual(after.hits, before.hits + 1)
+        self.assertEqual(after.misses, before.misses)
+        self.assertEqual(other.discounts, self.discount_mapping.discounts)
+
+        with open(self.test_discounts_path, "w") as f:
+            f.write("discounts:\n  e2: {'1yr_resource': 0.1}\n")
+        updated = MachineTypeDiscountMapping(config_path=self.test_discounts_path)
+        self.assertEqual(list(updated.discounts), ["e2"])
+
+    def test_mutating_one_instance_does_not_affect_others(self):
+        """Test that instances do not share mutable state via the parse cache."""
+        self.discount_mapping.discounts["n1"]["1yr_resource"] = 0.99
+        del self.discount_mapping.discounts["e2"]
+        self.discount_mapping.families["GPU"].append("n1")
+
+        other = MachineTypeDiscountMapping(config_path=self.test_discounts_path)
+        self.assertEqual(other.get_discount("n1", "1yr_resource"), 0.37)
+        self.assertIn("e2", other.discounts)
+        self.assertEqual(other.families["GPU"], ["gpu"])
+
+    def test_build_reference_table(self):
+        """Test that the reference table formats rates per base type."""
+        table = self.discount_mapping.build_reference_table()
+        self.assertEqual(table.index.tolist(), ["N1", "E2", "GPU"])
+        self.assertEqual(table.loc["N1", "Family"], "General Purpose")
+        self.assertEqual(table.loc["N1", "3-Yr Resource"], "55%")
+        self.assertEqual(table.loc["GPU", "SUD"], "10%")
+
+        with open(self.test_discounts_path, "w") as f:
+            f.write("discounts:\n  m3: {'1yr_resource': 0.45, '1yr_flex': null}\n")
+        sparse = MachineTypeDiscountMapping(config_path=self.test_discounts_path)
+        row = sparse.build_reference_table().loc["M3"]
+        self.assertEqual(row["1-Yr Resource"], "45%")
+        self.assertEqual(row["1-Yr Flex"], "N/A")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,15 @@
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
 from finops_analysis_platform.config_manager import ConfigManager
+from finops_analysis_platform.discount_mapping import MachineTypeDiscountMapping
 from finops_analysis_platform.models import PortfolioRecommendation
 from finops_analysis_platform.portfolio_recommender import (
     AIPortfolioRecommender,
     RuleBasedPortfolioRecommender,
 )
+from finops_analysis_platform.savings_calculator import SavingsCalculator
 
 
 class TestRuleBasedPortfolioRecommender(unittest.TestCase):
@@ -39,6 +42,35 @@ class TestRuleBasedPortfolioRecommender(unittest.TestCase):
         self.assertEqual(len(portfolio.layers), 2)
         self.assertAlmostEqual(portfolio.total_monthly_savings, 125.3)
 
+    def test_layers_sorted_by_savings(self):
+        """Test that layers are ordered by savings, highest first."""
+        savings_by_machine = {
+            name: {
+                "monthly_spend": spend,
+                "stable_workload": spend,
+                "savings_options": {"3yr_flex": {"monthly_savings": spend / 2}},
+            }
+            for name, spend in [("e2", 10), ("n2", 40), ("c2", 20), ("m1", 0)]
+        }
+        portfolio = self.recommender.recommend_portfolio(savings_by_machine)
+
+        self.assertEqual(
+            [layer.machine_type for layer in portfolio.layers], ["n2", "c2", "e2"]
+        )
+
+    def test_recommend_portfolio_from_savings_frame(self):
+        """Test that a savings frame gives the same portfolio as the dict."""
+        calculator = SavingsCalculator(ConfigManager(), MachineTypeDiscountMapping())
+        frame = calculator.calculate_savings_frame({"n2": 1000, "m3": 500, "zz": 10})
+
+        from_frame = self.recommender.recommend_portfolio(frame)
+        from_dict = self.recommender.recommend_portfolio(
+            calculator.frame_to_dict(frame)
+        )
+
+        self.assertEqual(from_frame, from_dict)
+        self.assertEqual(len(from_frame.layers), 2)
+
 
 class TestAIPortfolioRecommender(unittest.TestCase):
     """Test suite for the AIPortfolioRecommender class."""
@@ -80,6 +112,118 @@ class TestAIPortfolioRecommender(unittest.TestCase):
             location="us-central1",
         )
 
+    @patch("finops_analysis_platform.portfolio_recommender.generate_content")
+    def test_recommend_portfolio_with_ai_uses_cache(self, mock_generate_content):
+        """Test that an identical prompt is answered from the response cache."""
+        mock_response = MagicMock()
+        mock_response.text = '{"strategy_summary": "cached", "portfolio": []}'
+        mock_generate_content.return_value = mock_response
+        savings_by_machine = {"n1": {"monthly_spend": 300, "family": "General"}}
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            self.config_manager.config = {
+                "gcp": {"project_id": "test-project"},
+                "advanced": {"ai_cache_dir": cache_dir},
+            }
+            # A fresh recommender has an empty memo, so the disk cache answers.
+            first = AIPortfolioRecommender(self.config_manager).recommend_portfolio(
+                savings_by_machine
+            )
+            second = AIPortfolioRecommender(self.config_manager).recommend_portfolio(
+                savings_by_machine
+            )
+
+        self.assertEqual(first, second)
+        self.assertEqual(second["strategy_summary"], "cached")
+        mock_generate_content.assert_called_once()
+
+    @patch("finops_analysis_platform.portfolio_recommender.generate_content")
+    def test_recommend_portfolio_with_ai_memoizes_successes(
+        self, mock_generate_content
+    ):
+        """Test that successful responses are memoized and failures retried."""
+        mock_response = MagicMock()
+        mock_response.text = '{"strategy_summary": "memo", "portfolio": []}'
+        mock_generate_content.side_effect = [None, mock_response]
+        savings_by_machine = {"n1": {"monthly_spend": 300, "family": "General"}}
+        recommender = AIPortfolioRecommender(self.config_manager)
+
+        failed = recommender.recommend_portfolio(savings_by_machine)
+        first = recommender.recommend_portfolio(savings_by_machine)
+        first["portfolio"].append("mutated")
+        second = recommender.recommend_portfolio(savings_by_machine)
+
+        self.assertIn("error", failed)
+        self.assertEqual(second, {"strategy_summary": "memo", "portfolio": []})
+        self.assertEqual(mock_generate_content.call_count, 2)
+
+    @patch("finops_analysis_platform.portfolio_recommender.time.time")
+    @patch("finops_analysis_platform.portfolio_recommender.generate_content")
+    def test_ai_response_memo_honours_ttl(self, mock_generate_content, mock_time):
+        """Test that memoized responses expire, and a zero TTL disables them."""
+        mock_response = MagicMock()
+        mock_response.text = '{"strategy_summary": "memo", "portfolio": []}'
+        mock_generate_content.return_value = mock_response
+        savings_by_machine = {"n1": {"monthly_spend": 300, "family": "General"}}
+        self.config_manager.config = {
+            "gcp": {"project_id": "test-project"},
+            "advanced": {"ai_cache_ttl_seconds": 60},
+        }
+        recommender = AIPortfolioRecommender(self.config_manager)
+
+        mock_time.return_value = 1000.0
+        recommender.recommend_portfolio(savings_by_machine)
+        mock_time.return_value = 1059.0
+        recommender.recommend_portfolio(savings_by_machine)
+        self.assertEqual(mock_generate_content.call_count, 1)
+
+        mock_time.return_value = 1061.0
+        recommender.recommend_portfolio(savings_by_machine)
+        self.assertEqual(mock_generate_content.call_count, 2)
+
+        self.config_manager.config = {
+            "gcp": {"project_id": "test-project"},
+            "advanced": {"ai_cache_ttl_seconds": 0},
+        }
+        recommender = AIPortfolioRecommender(self.config_manager)
+        recommender.recommend_portfolio(savings_by_machine)
+        recommender.recommend_portfolio(savings_by_machine)
+        self.assertEqual(mock_generate_content.call_count, 4)
+
+    @patch("finops_analysis_platform.portfolio_recommender.generate_content")
+    def test_recommend_portfolio_with_ai_skips_negligible_spend(
+        self, mock_generate_content
+    ):
+        """Test that no AI request is made when no machine has billable spend."""
+        recommender = AIPortfolioRecommender(self.config_manager)
+
+        self.assertEqual(recommender.recommend_portfolio({}), {})
+        self.assertEqual(
+            recommender.recommend_portfolio(
+                {"e2": {"monthly_spend": 0.25, "family": "General Purpose"}}
+            ),
+            {},
+        )
+        mock_generate_content.assert_not_called()
+
+    @patch("finops_analysis_platform.portfolio_recommender.generate_content")
+    def test_ai_prompt_spend_data_is_compact(self, mock_generate_content):
+        """Test that prompt spend is rounded and negligible spend is dropped."""
+        mock_generate_content.return_value = None
+        recommender = AIPortfolioRecommender(self.config_manager)
+        recommender.recommend_portfolio(
+            {
+                "n2": {"monthly_spend": 1234.5678901, "family": "General Purpose"},
+                "e2": {"monthly_spend": 0.25, "family": "General Purpose"},
+            }
+        )
+
+        prompt = mock_generate_content.call_args.kwargs["prompt"]
+        self.assertIn(
+            '{"n2":{"monthly_spend":1234.57,"family":"General Purpose"}}', prompt
+        )
+        self.assertNotIn('"e2"', prompt)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -38,6 +38,20 @@ class TestReporting(unittest.TestCase):
             self.fail(f"create_dashboard raised an exception: {e}")
         # mock_show.assert_called_once() # This can be added if you want to ensure it's called
 
+    @patch("plotly.graph_objects.Figure.show")
+    def test_create_dashboard_with_savings_summary(self, mock_show):
+        """Test that per-strategy savings are charted next to the optimal mix."""
+        self.analysis_results.total_savings_summary = {
+            "1yr_resource": 50.0,
+            "3yr_resource": 80.0,
+            "optimal_mix": 100.0,
+        }
+        fig = create_dashboard(self.analysis_results, self.config_manager)
+        self.assertEqual(
+            list(fig.data[0].x),
+            ["1-Yr Resource", "3-Yr Resource", "Optimal Mix (Rule-Based)"],
+        )
+
     @patch("reportlab.platypus.SimpleDocTemplate.build")
     def test_generate_report_runs_without_error(self, mock_build):
         """Test that the PDF report generation function executes without errors."""
@@ -1,7 +1,9 @@
 import unittest
 
+import pandas as pd
+
 from finops_analysis_platform.models import RiskAssessment
-from finops_analysis_platform.risk_assessor import RiskAssessor
+from finops_analysis_platform.risk_assessor import RISK_TIERS, RiskAssessor
 
 
 class TestRiskAssessor(unittest.TestCase):
@@ -43,11 +45,38 @@ class TestRiskAssessor(unittest.TestCase):
         risk_assessment = self.risk_assessor.assess_risk(savings_by_machine)
         self.assertEqual(risk_assessment.overall_risk, "HIGH")
 
+    def test_classify_machine_types(self):
+        """Test that risk tiers follow the machine series prefix."""
+        machine_types = pd.Series(["gpu-t4", "a3", "h3", "c2d", "m3", "n2", "gcve"])
+        tiers = self.risk_assessor.classify_machine_types(machine_types)
+        self.assertEqual(
+            [RISK_TIERS[tier] for tier in tiers],
+            ["high", "high", "high", "low", "low", "medium", "medium"],
+        )
+
     def test_assess_risk_no_data(self):
         """Test the risk assessment with no input data."""
         risk_assessment = self.risk_assessor.assess_risk({})
         self.assertEqual(risk_assessment.overall_risk, "UNKNOWN")
 
+    def test_assess_risk_accepts_savings_frame(self):
+        """Test that a savings frame gives the same result as the dict."""
+        savings_by_machine = {
+            "n1": {"monthly_spend": 100},
+            "gpu": {"monthly_spend": 300},
+            "a2": {"monthly_spend": 100},
+        }
+        frame = pd.DataFrame.from_dict(savings_by_machine, orient="index")
+
+        from_dict = self.risk_assessor.assess_risk(savings_by_machine)
+        from_frame = self.risk_assessor.assess_risk(frame)
+
+        self.assertEqual(from_frame.overall_risk, from_dict.overall_risk)
+        self.assertEqual(from_frame.risk_distribution, from_dict.risk_distribution)
+        self.assertEqual(
+            from_dict.risk_distribution, {"low": 0.0, "medium": 100.0, "high": 400.0}
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
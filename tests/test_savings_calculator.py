@@ -64,6 +64,58 @@ prefixes: ['n1', 'e2']
             e2_savings_options["1yr_flex"]["monthly_savings"], 50 * 0.7 * 0.28
         )
 
+    def test_calculate_savings_frame(self):
+        """Test the columnar savings output."""
+        frame = self.savings_calculator.calculate_savings_frame({"n1": 300, "e2": 50})
+
+        self.assertEqual(frame.index.tolist(), ["n1", "e2"])
+        self.assertAlmostEqual(frame.loc["n1", "stable_workload"], 300 * 0.7)
+        self.assertAlmostEqual(frame.loc["e2", "savings_3yr_flex"], 50 * 0.7 * 0.46)
+        self.assertEqual(frame.loc["n1", "family"], "General Purpose")
+
+    def test_calculate_savings_by_full_machine_type(self):
+        """Test that full machine types are resolved to their base type."""
+        savings = self.savings_calculator.calculate_savings_by_machine(
+            {"n1-standard-8": 100}
+        )
+
+        options = savings["n1-standard-8"]["savings_options"]
+        self.assertAlmostEqual(options["1yr_resource"]["discount"], 0.37)
+        self.assertAlmostEqual(options["3yr_flex"]["monthly_savings"], 100 * 0.7 * 0.46)
+        self.assertEqual(savings["n1-standard-8"]["family"], "General Purpose")
+
+    def test_calculate_savings_frame_empty(self):
+        """Test that an empty distribution yields an empty frame."""
+        frame = self.savings_calculator.calculate_savings_frame({})
+
+        self.assertTrue(frame.empty)
+        self.assertEqual(
+            self.savings_calculator.summarize_savings(frame)["optimal_mix"], 0.0
+        )
+
+    def test_summarize_savings(self):
+        """Test the per-strategy and optimal-mix savings totals."""
+        frame = self.savings_calculator.calculate_savings_frame({"n1": 300, "e2": 50})
+        summary = self.savings_calculator.summarize_savings(frame)
+
+        self.assertAlmostEqual(summary["1yr_resource"], 350 * 0.7 * 0.37)
+        self.assertAlmostEqual(summary["3yr_flex"], 350 * 0.7 * 0.46)
+        self.assertAlmostEqual(summary["optimal_mix"], 350 * 0.7 * 0.55)
+
+    def test_recommendations(self):
+        """Test that each machine type gets the recommendation for its rates."""
+        frame = self.savings_calculator.calculate_savings_frame(
+            {"n1": 300, "unknown": 10}
+        )
+
+        self.assertEqual(
+            frame.loc["n1", "recommendation"], "3-Year Flex CUD (Good Flexibility)"
+        )
+        self.assertEqual(
+            frame.loc["unknown", "recommendation"],
+            "1-Year Flex CUD (Maximum Flexibility)",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
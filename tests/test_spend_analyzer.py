@@ -45,6 +45,71 @@ prefixes: ['n1', 'e2']
         self.assertAlmostEqual(distribution["n1"], 300)
         self.assertAlmostEqual(distribution["e2"], 50)
 
+    def test_analyze_machine_distribution_repeated_skus(self):
+        """Test aggregation over repeated SKUs with unparseable costs."""
+        billing_data = pd.DataFrame(
+            {
+                "Sku Description": ["e2-medium", "N1-standard-4", "e2-medium"] * 2,
+                "Cost": [10, 20, "n/a", 5, 5, 1.5],
+            }
+        )
+        distribution = self.spend_analyzer.analyze_machine_distribution(billing_data)
+        self.assertEqual(list(distribution), ["e2", "n1"])
+        self.assertAlmostEqual(distribution["e2"], 16.5)
+        self.assertAlmostEqual(distribution["n1"], 25)
+
+    def test_analyze_machine_distribution_missing_skus_and_infinite_cost(self):
+        """Test that None/NaN SKUs stay apart and infinite costs are kept."""
+        billing_data = pd.DataFrame(
+            {
+                "SKU": ["e2-medium", None, float("nan"), None, "c2-standard-4"],
+                "Cost": [1.0, 2.0, 4.0, 8.0, float("inf")],
+            }
+        )
+        distribution = self.spend_analyzer.analyze_machine_distribution(billing_data)
+        self.assertEqual(
+            distribution, {"e2": 1.0, "none": 10.0, "nan": 4.0, "c2": float("inf")}
+        )
+
+    def test_analyze_machine_distribution_from_csv(self):
+        """Test that chunked CSV aggregation matches the in-memory result."""
+        billing_data = pd.DataFrame(
+            {
+                "SKU": ["n1-standard-4", "e2-medium", "n1-standard-8", "e2-small"],
+                "Project": ["a", "b", "c", "d"],
+                "Cost": [100, 50, 200, 25],
+            }
+        )
+        csv_path = Path("test_billing.csv")
+        billing_data.to_csv(csv_path, index=False)
+        try:
+            distribution = self.spend_analyzer.analyze_machine_distribution_from_csv(
+                csv_path, chunksize=3
+            )
+        finally:
+            csv_path.unlink()
+
+        self.assertEqual(
+            distribution,
+            self.spend_analyzer.analyze_machine_distribution(billing_data),
+        )
+
+    def test_analyze_machine_distribution_from_empty_csv(self):
+        """Test that an empty CSV yields no spend rather than sample data."""
+        csv_path = Path("test_billing_empty.csv")
+        pd.DataFrame({"SKU": [], "Cost": []}).to_csv(csv_path, index=False)
+        try:
+            distribution = self.spend_analyzer.analyze_machine_distribution_from_csv(
+                csv_path
+            )
+        finally:
+            csv_path.unlink()
+
+        self.assertEqual(distribution, {})
+        self.assertEqual(
+            self.spend_analyzer.analyze_machine_distribution_chunks([]), {}
+        )
+
     def test_analyze_machine_distribution_empty_input(self):
         """Test the analysis with an empty or None DataFrame."""
         # Test with an empty DataFrame